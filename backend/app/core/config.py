@@ -9,7 +9,7 @@ and default value handling.
 from __future__ import annotations
 
 import sys
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, ValidationError, ConfigDict
 from pydantic_settings import BaseSettings
@@ -186,6 +186,10 @@ class Settings(BaseSettings):
         le=2048,
         description="Dimensionality of article embeddings used throughout event detection",
     )
+    embedding_dtype: Literal["float32", "float16", "bfloat16"] = Field(
+        default="float32",
+        description="Embedding inference precision (float32, float16 on CUDA, bfloat16)",
+    )
     model_cache_dir: str = Field(
         default="data/models",
         description="Directory where ML models and caches are stored",
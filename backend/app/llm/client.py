@@ -15,7 +15,6 @@ from typing import TypeVar, Type
 from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
-import json
 import re
 
 logger = get_logger(__name__)
@@ -135,51 +134,6 @@ def _strip_markdown_fences(content: str) -> str:
     return without_ticks.strip()
 
 
-def _normalize_spectrum_values(json_str: str) -> str:
-    """Normalize English spectrum values to Dutch equivalents."""
-
-    # Mapping of common English values to Dutch
-    spectrum_map = {
-        "center": "mainstream",
-        "centre": "mainstream",
-        "center-right": "mainstream",
-        "center-left": "mainstream",
-        "centre-right": "mainstream",
-        "centre-left": "mainstream",
-        "left": "links",
-        "left-wing": "links",
-        "right": "rechts",
-        "right-wing": "rechts",
-        "alternative": "alternatief",
-        "government": "overheid",
-        "social media": "sociale_media",
-        "social_media": "sociale_media",
-    }
-
-    # Parse JSON to normalize spectrum fields
-    try:
-        data = json.loads(json_str)
-
-        def normalize_obj(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == "spectrum" and isinstance(value, str):
-                        # Normalize the spectrum value
-                        normalized = spectrum_map.get(value.lower(), value)
-                        obj[key] = normalized
-                    elif isinstance(value, (dict, list)):
-                        normalize_obj(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    normalize_obj(item)
-
-        normalize_obj(data)
-        return json.dumps(data, ensure_ascii=False)
-    except Exception:
-        # If normalization fails, return original
-        return json_str
-
-
 class DeepSeekClient(BaseLLMClient):
     """Async client for the DeepSeek chat completion API (OpenAI-compatible)."""
 
@@ -273,7 +227,6 @@ class DeepSeekClient(BaseLLMClient):
                     raise LLMResponseError("Onvolledige respons van DeepSeek", retryable=False) from exc
 
                 json_content = _strip_markdown_fences(choice)
-                json_content = _normalize_spectrum_values(json_content)
                 try:
                     payload_model = InsightsPayload.model_validate_json(json_content)
                 except Exception as exc:
@@ -542,7 +495,6 @@ class DeepSeekClient(BaseLLMClient):
                     raise LLMResponseError("Onvolledige respons van DeepSeek", retryable=False) from exc
 
                 json_content = _strip_markdown_fences(choice)
-                json_content = _normalize_spectrum_values(json_content)
                 try:
                     payload_model = schema_class.model_validate_json(json_content)
                 except Exception as exc:
@@ -676,7 +628,6 @@ class GeminiClient(BaseLLMClient):
                     raise LLMResponseError("Gemini gaf een lege respons", retryable=True)
 
                 json_content = _strip_markdown_fences(response.text)
-                json_content = _normalize_spectrum_values(json_content)
 
                 try:
                     payload_model = InsightsPayload.model_validate_json(json_content)
@@ -877,7 +828,6 @@ class GeminiClient(BaseLLMClient):
                     raise LLMResponseError("Gemini gaf een lege respons", retryable=True)
 
                 json_content = _strip_markdown_fences(response.text)
-                json_content = _normalize_spectrum_values(json_content)
 
                 try:
                     payload_model = schema_class.model_validate_json(json_content)
@@ -1030,8 +980,6 @@ class MistralClient(BaseLLMClient):
                     raise LLMResponseError("Onvolledige respons van Mistral", retryable=False) from exc
 
                 json_content = _strip_markdown_fences(choice)
-                # Normalize spectrum values before validation
-                json_content = _normalize_spectrum_values(json_content)
                 try:
                     payload_model = InsightsPayload.model_validate_json(json_content)
                 except Exception as exc:  # pragma: no cover - validation detail surfaced to caller
@@ -1279,7 +1227,6 @@ class MistralClient(BaseLLMClient):
                     raise LLMResponseError("Onvolledige respons van Mistral", retryable=False) from exc
 
                 json_content = _strip_markdown_fences(choice)
-                json_content = _normalize_spectrum_values(json_content)
                 try:
                     payload_model = schema_class.model_validate_json(json_content)
                 except Exception as exc:
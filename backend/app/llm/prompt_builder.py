@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
-from collections import defaultdict, deque
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
+from itertools import accumulate
+from operator import attrgetter
 from textwrap import shorten
-from typing import List, Mapping, Sequence
+from typing import Dict, List, Mapping, Sequence
 
 from sqlalchemy import select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer
 
 from backend.app.core.config import Settings, get_settings
 from backend.app.core.logging import get_logger
@@ -21,10 +30,49 @@ from backend.app.db.session import get_sessionmaker
 from backend.app.services.llm_config_service import get_llm_config_service
 
 LOG = get_logger(__name__).bind(component="PromptBuilder")
-SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+_STDLIB_LOG = logging.getLogger(__name__)
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"[.!?]\s+")
+PLACEHOLDER_PATTERN = re.compile(r"\{(event_context|article_capsules|factual_summary)\}")
 SPECTRUM_FALLBACK = "onbekend"
 ARTICLE_CAPSULE_SENTENCE_LIMIT = 3
 DEFAULT_SUMMARY_CHAR_LIMIT = 320
+PROMPT_CACHE_SIZE = 128
+CAPSULE_BLOCK_CACHE_SIZE = 4096
+CAPSULE_SEPARATOR = "\n\n"
+_BY_REFERENCE_TIME = attrgetter("reference_time")
+
+# Columns read while building capsules; everything else (embeddings, TF-IDF
+# vectors, normalized text) stays in the database.
+_CAPSULE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    Article.summary,
+    Article.content,
+    Article.source_name,
+    Article.source_metadata,
+    Article.entities,
+    Article.published_at,
+    Article.fetched_at,
+    Article.updated_at,
+    Article.is_international,
+    Article.source_country,
+)
+
+# Static fragments of a rendered article capsule
+_SOURCE_PREFIX = "   Bron: "
+_SPECTRUM_SEP = " | Spectrum: "
+_TYPE_SEP = " | Type: "
+_PUBLISHED_PREFIX = "   Gepubliceerd: "
+_SUMMARY_PREFIX = "   Samenvatting: "
+_KEY_POINTS_HEADER = "   Kernpunten:"
+_KEY_POINT_PREFIX = "    - "
+_ENTITIES_PREFIX = "   Entiteiten: "
+_URL_PREFIX = "   URL: "
+
+
+class PromptBuilderError(RuntimeError):
+    """Raised when building a prompt is not possible."""
 
 
 def _load_template(filename: str = "pluriform_prompt.txt") -> str:
@@ -33,11 +81,76 @@ def _load_template(filename: str = "pluriform_prompt.txt") -> str:
     return template_path.read_text(encoding="utf-8")
 
 
-# File-based templates as fallbacks
-_FILE_PROMPT_TEMPLATE = _load_template("pluriform_prompt.txt")
-_FILE_FACTUAL_TEMPLATE = _load_template("factual_prompt.txt")
-_FILE_CRITICAL_TEMPLATE = _load_template("critical_prompt.txt")
-_FILE_KEYWORD_TEMPLATE = _load_template("keyword_extraction_prompt.txt")
+@lru_cache(maxsize=32)
+def _compile_template(template: str) -> tuple[str, ...]:
+    """Split a template once into alternating literal segments and placeholder names."""
+    return tuple(PLACEHOLDER_PATTERN.split(template))
+
+
+def _render_template(template: str, **values: str) -> str:
+    """Fill template placeholders in a single join over the precompiled segments.
+
+    Placeholders without a provided value are left untouched, like ``str.replace`` would.
+    """
+    parts = _compile_template(template)
+    return "".join(
+        part if idx % 2 == 0 else values.get(part, f"{{{part}}}")
+        for idx, part in enumerate(parts)
+    )
+
+
+def _fit_block_count(template: str, context: str, blocks: Sequence[str], max_chars: int) -> int:
+    """Return how many leading capsule blocks fit in the rendered prompt (at least one).
+
+    Block sizes are known after a single formatting pass, so the cut-off is found by
+    bisecting prefix sums instead of re-rendering the prompt per dropped capsule.
+    """
+    if not blocks:
+        return 0
+    capsule_slots = _compile_template(template)[1::2].count("article_capsules")
+    if not capsule_slots:
+        return len(blocks)
+    overhead = len(_render_template(template, event_context=context, article_capsules=""))
+    # prefix[k] is the joined length of the first k blocks plus one trailing separator
+    prefix = list(accumulate((len(block) + len(CAPSULE_SEPARATOR) for block in blocks), initial=0))
+    budget = (max_chars - overhead) // capsule_slots + len(CAPSULE_SEPARATOR)
+    keep = bisect_right(prefix, budget) - 1
+    return max(1, min(keep, len(blocks)))
+
+
+# Placeholders each prompt kind must contain exactly once
+_TEMPLATE_PLACEHOLDERS: dict[str, tuple[str, ...]] = {
+    "pluriform": ("event_context", "article_capsules"),
+    "factual": ("event_context", "article_capsules"),
+    "critical": ("event_context", "article_capsules", "factual_summary"),
+    "keyword_extraction": ("event_context",),
+}
+
+
+def _template_placeholder_errors(key: str, template: str) -> List[str]:
+    """Describe required placeholders that are missing or repeated in ``template``."""
+    found = _compile_template(template)[1::2]
+    errors: List[str] = []
+    for name in _TEMPLATE_PLACEHOLDERS.get(key, ()):
+        count = found.count(name)
+        if count != 1:
+            errors.append(f"{{{name}}} komt {count}x voor")
+    return errors
+
+
+def _load_checked_template(key: str, filename: str) -> str:
+    template = _load_template(filename)
+    errors = _template_placeholder_errors(key, template)
+    if errors:
+        raise PromptBuilderError(f"Prompttemplate {filename} is ongeldig: {'; '.join(errors)}")
+    return template
+
+
+# File-based templates as fallbacks; placeholders are verified once at import
+_FILE_PROMPT_TEMPLATE = _load_checked_template("pluriform", "pluriform_prompt.txt")
+_FILE_FACTUAL_TEMPLATE = _load_checked_template("factual", "factual_prompt.txt")
+_FILE_CRITICAL_TEMPLATE = _load_checked_template("critical", "critical_prompt.txt")
+_FILE_KEYWORD_TEMPLATE = _load_checked_template("keyword_extraction", "keyword_extraction_prompt.txt")
 
 # Legacy aliases for backwards compatibility
 PROMPT_TEMPLATE = _FILE_PROMPT_TEMPLATE
@@ -52,7 +165,10 @@ async def _get_prompt_from_db(key: str, fallback: str) -> str:
         config_service = get_llm_config_service()
         db_value = await config_service.get_value(f"prompt_{key}")
         if db_value and db_value.strip():
-            return db_value
+            errors = _template_placeholder_errors(key, db_value)
+            if not errors:
+                return db_value
+            LOG.warning("prompt_db_template_invalid", key=key, errors=errors)
     except Exception as e:
         LOG.warning("prompt_db_load_failed", key=key, error=str(e))
     return fallback
@@ -78,8 +194,42 @@ class KeywordPromptResult:
     event_id: int
 
 
-class PromptBuilderError(RuntimeError):
-    """Raised when building a prompt is not possible."""
+# Last-built prompts keyed by event state, so LLM retries for an unchanged event
+# skip capsule building, selection and formatting entirely.
+_PROMPT_CACHE: OrderedDict[tuple, PromptGenerationResult] = OrderedDict()
+_CAPSULE_BLOCK_CACHE: OrderedDict[tuple, str] = OrderedDict()
+
+
+def _prompt_cache_key(
+    kind: str,
+    event: Event,
+    articles: Sequence[Row],
+    template: str,
+    *extra: object,
+) -> tuple:
+    """Build a cheap cache key that changes whenever the rendered prompt could change."""
+    article_state = hash(tuple(sorted((article.id, article.updated_at) for article in articles)))
+    return (kind, event.id, event.last_updated_at, article_state, hash(template), *extra)
+
+
+def _get_cached_prompt(key: tuple) -> PromptGenerationResult | None:
+    result = _PROMPT_CACHE.get(key)
+    if result is not None:
+        _PROMPT_CACHE.move_to_end(key)
+    return result
+
+
+def _store_cached_prompt(key: tuple, result: PromptGenerationResult) -> None:
+    _PROMPT_CACHE[key] = result
+    _PROMPT_CACHE.move_to_end(key)
+    while len(_PROMPT_CACHE) > PROMPT_CACHE_SIZE:
+        _PROMPT_CACHE.popitem(last=False)
+
+
+def clear_prompt_cache() -> None:
+    """Drop all cached prompts (e.g. after re-enriching articles in bulk)."""
+    _PROMPT_CACHE.clear()
+    _CAPSULE_BLOCK_CACHE.clear()
 
 
 @dataclass(slots=True)
@@ -100,10 +250,13 @@ class ArticleCapsule:
     # International perspectives (Epic 9)
     is_international: bool = False
     source_country: str | None = None
+    # Source row version; keys the rendered block cache when present
+    updated_at: datetime | None = None
+    # Sort key for selection and context; resolved once instead of per comparison.
+    reference_time: datetime = field(init=False)
 
-    @property
-    def reference_time(self) -> datetime:
-        return self.published_at or self.fetched_at
+    def __post_init__(self) -> None:
+        self.reference_time = self.published_at or self.fetched_at
 
 
 class PromptBuilder:
@@ -139,15 +292,22 @@ class PromptBuilder:
         if limit <= 0:
             raise PromptBuilderError("Article cap must be positive")
 
-        async with get_read_session() as session:
-            event = await self._fetch_event(session, event_id)
-            articles = await self._fetch_articles(session, event_id)
+        event, articles = await self._load_event_and_articles(event_id)
 
         if not articles:
             raise PromptBuilderError(
                 f"Event {event_id} has no linked articles; rerun enrichment pipeline first"
             )
 
+        # Load template from database, fallback to file-based
+        template = await _get_prompt_from_db("pluriform", self.template)
+        max_chars = self.settings.llm_prompt_max_characters
+        cache_key = _prompt_cache_key("pluriform", event, articles, template, limit, max_chars)
+        cached = _get_cached_prompt(cache_key)
+        if cached is not None:
+            LOG.debug("prompt_cache_hit", event_id=event_id, prompt_length=cached.prompt_length)
+            return cached
+
         capsules = self._build_capsules(articles)
         selected = self._select_balanced_subset(capsules, limit=limit)
         if not selected:
@@ -156,35 +316,38 @@ class PromptBuilder:
             )
 
         context_block = self._format_event_context(event, selected, total=len(capsules))
-        capsule_block = self._format_article_capsules(selected)
-
-        # Load template from database, fallback to file-based
-        template = await _get_prompt_from_db("pluriform", self.template)
-        prompt = template
-        prompt = prompt.replace("{event_context}", context_block)
-        prompt = prompt.replace("{article_capsules}", capsule_block)
+        capsule_blocks = self._format_article_capsule_parts(selected)
+        capsule_block = CAPSULE_SEPARATOR.join(capsule_blocks)
 
+        prompt = _render_template(
+            template, event_context=context_block, article_capsules=capsule_block
+        )
         prompt_length = len(prompt)
-        max_chars = self.settings.llm_prompt_max_characters
 
         # Iteratively reduce article count if prompt is still too long after trimming
         while prompt_length > max_chars and len(selected) > 1:
             if prompt_length > max_chars:
-                trimmed_block, trimmed_capsules = self._trim_prompt(selected, context_block)
-                prompt = self.template
-                prompt = prompt.replace("{event_context}", context_block)
-                prompt = prompt.replace("{article_capsules}", trimmed_block)
+                trimmed_block, trimmed_capsules = self._trim_prompt(
+                    selected, context_block, blocks=capsule_blocks
+                )
+                prompt = _render_template(
+                    self.template, event_context=context_block, article_capsules=trimmed_block
+                )
                 selected = trimmed_capsules
+                # Trimming only ever drops a tail, so the rendered blocks stay aligned
+                del capsule_blocks[len(selected):]
                 prompt_length = len(prompt)
 
             # If still too long, reduce article count and rebuild
             if prompt_length > max_chars and len(selected) > 1:
-                # Reduce by one article and try again
+                # Reduce by one article and try again; blocks are numbered from the
+                # start, so dropping the last one leaves the others valid as rendered
                 selected = selected[:-1]
-                capsule_block = self._format_article_capsules(selected)
-                prompt = self.template
-                prompt = prompt.replace("{event_context}", context_block)
-                prompt = prompt.replace("{article_capsules}", capsule_block)
+                capsule_blocks.pop()
+                capsule_block = CAPSULE_SEPARATOR.join(capsule_blocks)
+                prompt = _render_template(
+                    self.template, event_context=context_block, article_capsules=capsule_block
+                )
                 prompt_length = len(prompt)
                 LOG.debug(
                     "prompt_too_long_reducing",
@@ -209,43 +372,68 @@ class PromptBuilder:
             prompt_length=prompt_length,
             limit=max_chars,
         )
-        return PromptGenerationResult(
+        result = PromptGenerationResult(
             prompt=prompt,
             prompt_length=prompt_length,
             selected_article_ids=[capsule.article_id for capsule in selected],
             selected_count=len(selected),
             total_articles=len(capsules),
         )
+        _store_cached_prompt(cache_key, result)
+        return result
+
+    async def _load_event_and_articles(self, event_id: int) -> tuple[Event, List[Row]]:
+        """Fetch the event and its article rows concurrently on separate read sessions."""
+
+        async def load_event() -> Event:
+            async with get_read_session() as session:
+                return await self._fetch_event(session, event_id)
+
+        async def load_articles() -> List[Row]:
+            async with get_read_session() as session:
+                return await self._fetch_articles(session, event_id)
+
+        event, articles = await asyncio.gather(load_event(), load_articles())
+        return event, articles
 
     async def _fetch_event(self, session: AsyncSession, event_id: int) -> Event:
-        event = await session.get(Event, event_id)
+        event = await session.get(
+            Event,
+            event_id,
+            options=[
+                defer(Event.centroid_embedding, raiseload=True),
+                defer(Event.centroid_tfidf, raiseload=True),
+            ],
+        )
         if event is None or event.archived_at is not None:
             raise PromptBuilderError(f"Event {event_id} bestaat niet of is gearchiveerd")
         return event
 
-    async def _fetch_articles(self, session: AsyncSession, event_id: int) -> List[Article]:
+    async def _fetch_articles(self, session: AsyncSession, event_id: int) -> List[Row]:
+        # Plain column rows: capsules only read these attributes, so skip ORM
+        # instance hydration and identity-map bookkeeping entirely.
         stmt = (
-            select(Article)
+            select(*_CAPSULE_COLUMNS)
             .join(EventArticle, EventArticle.article_id == Article.id)
             .where(EventArticle.event_id == event_id)
             .order_by(Article.published_at.desc(), Article.fetched_at.desc())
         )
         result = await session.execute(stmt)
-        articles = list(result.scalars().all())
-        return articles
+        return list(result.all())
 
-    def _build_capsules(self, articles: Sequence[Article]) -> List[ArticleCapsule]:
+    def _build_capsules(self, articles: Sequence[Row]) -> List[ArticleCapsule]:
         capsules: List[ArticleCapsule] = []
+        source_fields: Dict[tuple[object, object], tuple[str, str]] = {}
         for article in articles:
             if not article.content or not article.content.strip():
                 raise PromptBuilderError(
                     "Artikel mist volledige content; voer de verrijkingsstap opnieuw uit voordat je een prompt bouwt"
                 )
 
-            spectrum = _coerce_spectrum(article.source_metadata)
-            source_type = _coerce_source_type(article.source_metadata)
-            summary = _derive_summary(article)
-            key_points = _extract_key_points(article)
+            spectrum, source_type = _coerce_source_fields(article.source_metadata, source_fields)
+            sentences = _split_sentences(article.content)
+            summary = _derive_summary(article, sentences)
+            key_points = _extract_key_points(sentences)
             entities = _extract_entities(article)
 
             capsules.append(
@@ -263,6 +451,7 @@ class PromptBuilder:
                     entities=entities,
                     is_international=article.is_international,
                     source_country=article.source_country,
+                    updated_at=article.updated_at,
                 )
             )
         return capsules
@@ -277,61 +466,37 @@ class PromptBuilder:
         international = [c for c in capsules if c.is_international]
         dutch = [c for c in capsules if not c.is_international]
 
-        selection: List[ArticleCapsule] = []
-
         # Step 2: Include ALL international articles first (they provide unique perspectives)
         # Sort by recency and add to selection
-        international_sorted = sorted(
-            international, key=lambda c: c.reference_time, reverse=True
-        )
-        for capsule in international_sorted:
-            if len(selection) >= limit:
-                break
-            selection.append(capsule)
-
-        remaining_slots = limit - len(selection)
+        selection = sorted(international, key=_BY_REFERENCE_TIME, reverse=True)[:limit]
+        remaining = limit - len(selection)
 
         # Step 3: Fill remaining slots with Dutch articles using balanced spectrum selection
-        if remaining_slots > 0 and dutch:
-            grouped: Mapping[str, deque[ArticleCapsule]] = _group_by_spectrum(dutch)
-            ordered_spectra = _order_spectra(grouped)
-
-            iteration = 0
-            while len(selection) < limit and ordered_spectra:
-                iteration += 1
-                for spectrum in list(ordered_spectra):
-                    queue = grouped.get(spectrum)
-                    if not queue:
-                        continue
-                    if len(selection) >= limit:
-                        break
-                    capsule = queue.popleft()
-                    selection.append(capsule)
-                    if not queue:
-                        grouped.pop(spectrum, None)
-                ordered_spectra = _order_spectra(grouped)
-                if iteration > limit * 2:
+        if remaining > 0 and dutch:
+            # Round r takes the r-th most recent capsule of every spectrum. Full rounds
+            # are taken whole (the final sort orders them); only a partial last round
+            # needs ordering by head recency to pick which spectra get the slots.
+            buckets = list(_group_by_spectrum(dutch).values())
+            for depth in range(max(len(bucket) for bucket in buckets)):
+                heads = [bucket[depth] for bucket in buckets if len(bucket) > depth]
+                if len(heads) >= remaining:
+                    heads.sort(key=_BY_REFERENCE_TIME, reverse=True)
+                    selection.extend(heads[:remaining])
                     break
-
-        if len(selection) > limit:
-            selection = selection[:limit]
-
-        selection.sort(key=lambda item: item.reference_time, reverse=True)
-        LOG.info(
-            "article_selection",
-            selected=[
-                {
-                    "article_id": item.article_id,
-                    "spectrum": item.spectrum,
-                    "is_international": item.is_international,
-                    "source_country": item.source_country,
-                    "published_at": item.reference_time.isoformat(),
-                }
-                for item in selection
-            ],
-            international_count=len([s for s in selection if s.is_international]),
-            dutch_count=len([s for s in selection if not s.is_international]),
-        )
+                selection.extend(heads)
+                remaining -= len(heads)
+
+        selection.sort(key=_BY_REFERENCE_TIME, reverse=True)
+        # Mirrors structlog's filter_by_level so the payload is only built when emitted.
+        if _STDLIB_LOG.isEnabledFor(logging.INFO):
+            international_count = sum(1 for item in selection if item.is_international)
+            LOG.info(
+                "article_selection",
+                article_ids=[item.article_id for item in selection],
+                spectra=[item.spectrum for item in selection],
+                international_count=international_count,
+                dutch_count=len(selection) - international_count,
+            )
         return selection
 
     def _format_event_context(
@@ -346,13 +511,15 @@ class PromptBuilder:
         latest = max(times).isoformat() if times else "onbekend"
         distribution = _assemble_distribution(event, capsules)
 
-        # Count international sources
-        international_capsules = [c for c in capsules if c.is_international]
-        dutch_count = len(capsules) - len(international_capsules)
-        international_count = len(international_capsules)
-        international_countries = sorted(set(
-            c.source_country for c in international_capsules if c.source_country
-        ))
+        # Count international sources in a single pass
+        international_count = 0
+        countries: set[str] = set()
+        for capsule in capsules:
+            if capsule.is_international:
+                international_count += 1
+                if capsule.source_country:
+                    countries.add(capsule.source_country)
+        dutch_count = len(capsules) - international_count
 
         lines = [
             f"- Event ID: {event.id}",
@@ -363,61 +530,40 @@ class PromptBuilder:
             f"- Nederlandse bronnen: {dutch_count}",
             f"- Internationale bronnen: {international_count}",
         ]
-        if international_countries:
-            lines.append(f"- Landen internationale bronnen: {', '.join(international_countries)}")
+        if countries:
+            lines.append(f"- Landen internationale bronnen: {', '.join(sorted(countries))}")
         lines.append("- Spectrumverdeling (geselecteerde subset):")
-        for spectrum, count in distribution.items():
-            lines.append(f"  * {spectrum}: {count}")
+        lines.extend(f"  * {spectrum}: {count}" for spectrum, count in distribution.items())
         if event.tags:
             tags = ", ".join(event.tags)
             lines.append(f"- Labels: {tags}")
         return "\n".join(lines)
 
     def _format_article_capsules(self, capsules: Sequence[ArticleCapsule]) -> str:
-        blocks: List[str] = []
-        for idx, capsule in enumerate(capsules, start=1):
-            timeframe = capsule.reference_time.isoformat()
-            key_points = capsule.key_points or [capsule.summary]
-            key_block = "\n".join(f"    - {point}" for point in key_points)
-            entity_block = ", ".join(capsule.entities[:5]) or "geen expliciete entiteiten"
-            # Build source line with optional country for international sources
-            source_line = f"   Bron: {capsule.source_name} | Spectrum: {capsule.spectrum} | Type: {capsule.source_type}"
-            if capsule.is_international and capsule.source_country:
-                source_line += f" | Land: {capsule.source_country} (INTERNATIONAAL)"
-            block = (
-                f"{idx}. {capsule.title}\n"
-                f"{source_line}\n"
-                f"   Gepubliceerd: {timeframe}\n"
-                f"   Samenvatting: {capsule.summary}\n"
-                f"   Kernpunten:\n{key_block}\n"
-                f"   Entiteiten: {entity_block}\n"
-                f"   URL: {capsule.url}"
-            )
-            blocks.append(block)
-        return "\n\n".join(blocks)
+        return CAPSULE_SEPARATOR.join(self._format_article_capsule_parts(capsules))
+
+    def _format_article_capsule_parts(self, capsules: Sequence[ArticleCapsule]) -> List[str]:
+        """Render each capsule into its own numbered block (joined with blank lines)."""
+        return [f"{idx}. {_capsule_body(capsule)}" for idx, capsule in enumerate(capsules, start=1)]
 
     def _trim_prompt(
         self,
         capsules: Sequence[ArticleCapsule],
         context: str,
+        *,
+        blocks: Sequence[str] | None = None,
     ) -> tuple[str, List[ArticleCapsule]]:
-        """Trim article capsules until prompt roughly fits the character budget."""
-
-        max_chars = self.settings.llm_prompt_max_characters
-        trimmed_capsules = list(capsules)
-        blocks = self._format_article_capsules(trimmed_capsules)
-        prompt = self.template.replace("{event_context}", context).replace("{article_capsules}", blocks)
-        if len(prompt) <= max_chars:
-            return blocks, trimmed_capsules
+        """Trim article capsules until prompt roughly fits the character budget.
 
-        while len(trimmed_capsules) > 1:
-            trimmed_capsules.pop()
-            blocks = self._format_article_capsules(trimmed_capsules)
-            prompt = self.template.replace("{event_context}", context).replace("{article_capsules}", blocks)
-            if len(prompt) <= max_chars:
-                return blocks, trimmed_capsules
+        ``blocks`` may carry the already formatted capsules so they are not rendered twice.
+        """
 
-        return blocks, trimmed_capsules
+        if blocks is None:
+            blocks = self._format_article_capsule_parts(capsules)
+        keep = _fit_block_count(
+            self.template, context, blocks, self.settings.llm_prompt_max_characters
+        )
+        return CAPSULE_SEPARATOR.join(blocks[:keep]), list(capsules[:keep])
 
     async def build_factual_prompt_package(
         self,
@@ -430,15 +576,21 @@ class PromptBuilder:
         if limit <= 0:
             raise PromptBuilderError("Article cap must be positive")
 
-        async with get_read_session() as session:
-            event = await self._fetch_event(session, event_id)
-            articles = await self._fetch_articles(session, event_id)
+        event, articles = await self._load_event_and_articles(event_id)
 
         if not articles:
             raise PromptBuilderError(
                 f"Event {event_id} has no linked articles; rerun enrichment pipeline first"
             )
 
+        # Load template from database, fallback to file-based
+        template = await _get_prompt_from_db("factual", _FILE_FACTUAL_TEMPLATE)
+        cache_key = _prompt_cache_key("factual", event, articles, template, limit)
+        cached = _get_cached_prompt(cache_key)
+        if cached is not None:
+            LOG.debug("factual_prompt_cache_hit", event_id=event_id, prompt_length=cached.prompt_length)
+            return cached
+
         capsules = self._build_capsules(articles)
         selected = self._select_balanced_subset(capsules, limit=limit)
         if not selected:
@@ -449,11 +601,9 @@ class PromptBuilder:
         context_block = self._format_event_context(event, selected, total=len(capsules))
         capsule_block = self._format_article_capsules(selected)
 
-        # Load template from database, fallback to file-based
-        template = await _get_prompt_from_db("factual", _FILE_FACTUAL_TEMPLATE)
-        prompt = template
-        prompt = prompt.replace("{event_context}", context_block)
-        prompt = prompt.replace("{article_capsules}", capsule_block)
+        prompt = _render_template(
+            template, event_context=context_block, article_capsules=capsule_block
+        )
 
         LOG.info(
             "factual_prompt_built",
@@ -461,13 +611,15 @@ class PromptBuilder:
             selected_count=len(selected),
             prompt_length=len(prompt),
         )
-        return PromptGenerationResult(
+        result = PromptGenerationResult(
             prompt=prompt,
             prompt_length=len(prompt),
             selected_article_ids=[c.article_id for c in selected],
             selected_count=len(selected),
             total_articles=len(capsules),
         )
+        _store_cached_prompt(cache_key, result)
+        return result
 
     async def build_critical_prompt_package(
         self,
@@ -481,15 +633,23 @@ class PromptBuilder:
         if limit <= 0:
             raise PromptBuilderError("Article cap must be positive")
 
-        async with get_read_session() as session:
-            event = await self._fetch_event(session, event_id)
-            articles = await self._fetch_articles(session, event_id)
+        event, articles = await self._load_event_and_articles(event_id)
 
         if not articles:
             raise PromptBuilderError(
                 f"Event {event_id} has no linked articles; rerun enrichment pipeline first"
             )
 
+        # Load template from database, fallback to file-based
+        template = await _get_prompt_from_db("critical", _FILE_CRITICAL_TEMPLATE)
+        cache_key = _prompt_cache_key(
+            "critical", event, articles, template, limit, hash(factual_summary)
+        )
+        cached = _get_cached_prompt(cache_key)
+        if cached is not None:
+            LOG.debug("critical_prompt_cache_hit", event_id=event_id, prompt_length=cached.prompt_length)
+            return cached
+
         capsules = self._build_capsules(articles)
         selected = self._select_balanced_subset(capsules, limit=limit)
         if not selected:
@@ -500,12 +660,12 @@ class PromptBuilder:
         context_block = self._format_event_context(event, selected, total=len(capsules))
         capsule_block = self._format_article_capsules(selected)
 
-        # Load template from database, fallback to file-based
-        template = await _get_prompt_from_db("critical", _FILE_CRITICAL_TEMPLATE)
-        prompt = template
-        prompt = prompt.replace("{event_context}", context_block)
-        prompt = prompt.replace("{factual_summary}", factual_summary)
-        prompt = prompt.replace("{article_capsules}", capsule_block)
+        prompt = _render_template(
+            template,
+            event_context=context_block,
+            factual_summary=factual_summary,
+            article_capsules=capsule_block,
+        )
 
         LOG.info(
             "critical_prompt_built",
@@ -513,13 +673,15 @@ class PromptBuilder:
             selected_count=len(selected),
             prompt_length=len(prompt),
         )
-        return PromptGenerationResult(
+        result = PromptGenerationResult(
             prompt=prompt,
             prompt_length=len(prompt),
             selected_article_ids=[c.article_id for c in selected],
             selected_count=len(selected),
             total_articles=len(capsules),
         )
+        _store_cached_prompt(cache_key, result)
+        return result
 
     async def build_keyword_extraction_prompt(
         self,
@@ -562,7 +724,7 @@ class PromptBuilder:
 
         # Load template from database, fallback to file-based
         template = await _get_prompt_from_db("keyword_extraction", _FILE_KEYWORD_TEMPLATE)
-        prompt = template.replace("{event_context}", context_block)
+        prompt = _render_template(template, event_context=context_block)
 
         LOG.info(
             "keyword_extraction_prompt_built",
@@ -576,56 +738,102 @@ class PromptBuilder:
         )
 
 
-def _coerce_spectrum(metadata: Mapping[str, object] | None) -> str:
-    spectrum = None
+def _capsule_body(capsule: ArticleCapsule) -> str:
+    """Return the rendered capsule block minus its position number, cached per article version."""
+    if capsule.updated_at is None:
+        return _render_capsule_body(capsule)
+    key = (capsule.article_id, capsule.updated_at)
+    body = _CAPSULE_BLOCK_CACHE.get(key)
+    if body is not None:
+        _CAPSULE_BLOCK_CACHE.move_to_end(key)
+        return body
+    body = _CAPSULE_BLOCK_CACHE[key] = _render_capsule_body(capsule)
+    if len(_CAPSULE_BLOCK_CACHE) > CAPSULE_BLOCK_CACHE_SIZE:
+        _CAPSULE_BLOCK_CACHE.popitem(last=False)
+    return body
+
+
+def _render_capsule_body(capsule: ArticleCapsule) -> str:
+    # Collect every line of the block and join once, instead of nesting
+    # a key-point join inside one large multi-line f-string
+    parts: List[str] = [
+        capsule.title,
+        f"{_SOURCE_PREFIX}{capsule.source_name}{_SPECTRUM_SEP}{capsule.spectrum}"
+        f"{_TYPE_SEP}{capsule.source_type}",
+    ]
+    # Source line gets an optional country for international sources
+    if capsule.is_international and capsule.source_country:
+        parts[-1] += f" | Land: {capsule.source_country} (INTERNATIONAAL)"
+    parts.append(_PUBLISHED_PREFIX + capsule.reference_time.isoformat())
+    parts.append(_SUMMARY_PREFIX + capsule.summary)
+    parts.append(_KEY_POINTS_HEADER)
+    for point in capsule.key_points or (capsule.summary,):
+        parts.append(_KEY_POINT_PREFIX + point)
+    parts.append(_ENTITIES_PREFIX + (", ".join(capsule.entities[:5]) or "geen expliciete entiteiten"))
+    parts.append(_URL_PREFIX + capsule.url)
+    return "\n".join(parts)
+
+
+def _coerce_source_fields(
+    metadata: Mapping[str, object] | None,
+    memo: Dict[tuple[object, object], tuple[str, str]],
+) -> tuple[str, str]:
+    """Return ``(spectrum, source_type)`` from one pass over the source metadata.
+
+    Articles within an event share a handful of sources, so the coerced pair is
+    memoized on the raw values for the duration of a single capsule build.
+    """
+    raw_spectrum = raw_type = None
     if metadata and isinstance(metadata, Mapping):
-        spectrum = metadata.get("spectrum") or metadata.get("political_spectrum")
-    if not spectrum:
-        return SPECTRUM_FALLBACK
-    return str(spectrum).lower()
+        raw_spectrum = metadata.get("spectrum") or metadata.get("political_spectrum")
+        raw_type = metadata.get("media_type") or metadata.get("type")
+    key = (raw_spectrum, raw_type)
+    try:
+        return memo[key]
+    except KeyError:
+        fields = memo[key] = _coerce_source_values(raw_spectrum, raw_type)
+        return fields
+    except TypeError:  # unhashable metadata values
+        return _coerce_source_values(raw_spectrum, raw_type)
 
 
-def _coerce_source_type(metadata: Mapping[str, object] | None) -> str:
-    if metadata and isinstance(metadata, Mapping):
-        source_type = metadata.get("media_type") or metadata.get("type")
-        if source_type:
-            return str(source_type)
-    return "onbekend"
+def _coerce_source_values(raw_spectrum: object, raw_type: object) -> tuple[str, str]:
+    # Interned so equal labels share one object across grouping and distribution dicts.
+    spectrum = sys.intern(str(raw_spectrum).lower()) if raw_spectrum else SPECTRUM_FALLBACK
+    source_type = sys.intern(str(raw_type)) if raw_type else "onbekend"
+    return spectrum, source_type
 
 
-def _derive_summary(article: Article) -> str:
+def _derive_summary(article: Row, sentences: Sequence[str]) -> str:
     summary = article.summary or ""
     if summary:
         return shorten(summary.strip(), width=DEFAULT_SUMMARY_CHAR_LIMIT, placeholder="...")
-    sentences = _split_sentences(article.content)
     if not sentences:
         return shorten(article.content.strip(), width=DEFAULT_SUMMARY_CHAR_LIMIT, placeholder="...")
     return shorten(sentences[0], width=DEFAULT_SUMMARY_CHAR_LIMIT, placeholder="...")
 
 
-def _extract_key_points(article: Article) -> List[str]:
-    sentences = _split_sentences(article.content)
+def _extract_key_points(sentences: Sequence[str]) -> List[str]:
     if not sentences:
         return []
     primary = sentences[:ARTICLE_CAPSULE_SENTENCE_LIMIT]
     # Remove potential duplicates with summary
     unique: List[str] = []
     seen = set()
+    # _split_sentences yields non-empty, already stripped sentences
     for sentence in primary:
-        normalized = sentence.strip()
-        if not normalized:
-            continue
-        key = normalized.lower()
+        key = sentence.lower()
         if key in seen:
             continue
         seen.add(key)
-        unique.append(shorten(normalized, width=DEFAULT_SUMMARY_CHAR_LIMIT, placeholder="..."))
+        unique.append(shorten(sentence, width=DEFAULT_SUMMARY_CHAR_LIMIT, placeholder="..."))
     return unique
 
 
-def _extract_entities(article: Article) -> List[str]:
+def _extract_entities(article: Row) -> List[str]:
     raw = article.entities or []
     entities: List[str] = []
+    seen: set[str] = set()
     for entity in raw:
         if not isinstance(entity, Mapping):
             continue
@@ -634,7 +842,8 @@ def _extract_entities(article: Article) -> List[str]:
         if not text:
             continue
         descriptor = text if not label else f"{text} ({label})"
-        if descriptor not in entities:
+        if descriptor not in seen:
+            seen.add(descriptor)
             entities.append(descriptor)
     return entities
 
@@ -643,35 +852,26 @@ def _split_sentences(text: str) -> List[str]:
     clean = text.strip()
     if not clean:
         return []
-    parts = SENTENCE_PATTERN.split(clean)
-    sentences = [part.strip() for part in parts if part.strip()]
-    if not sentences:
-        sentences = [clean]
+    # Walk the terminator+whitespace boundaries directly: every slice ends on its
+    # terminator and starts after a whitespace run, so no per-part strip is needed.
+    sentences: List[str] = []
+    start = 0
+    for boundary in SENTENCE_BOUNDARY_PATTERN.finditer(clean):
+        sentences.append(clean[start : boundary.start() + 1])
+        start = boundary.end()
+    sentences.append(clean[start:])
     return sentences
 
 
-def _group_by_spectrum(capsules: Sequence[ArticleCapsule]) -> Mapping[str, deque[ArticleCapsule]]:
-    grouped: dict[str, deque[ArticleCapsule]] = defaultdict(deque)
+def _group_by_spectrum(capsules: Sequence[ArticleCapsule]) -> Mapping[str, List[ArticleCapsule]]:
+    grouped: dict[str, List[ArticleCapsule]] = defaultdict(list)
     for capsule in capsules:
         grouped[capsule.spectrum].append(capsule)
-    for queue in grouped.values():
-        ordered = sorted(queue, key=lambda item: item.reference_time, reverse=True)
-        queue.clear()
-        queue.extend(ordered)
+    for bucket in grouped.values():
+        bucket.sort(key=_BY_REFERENCE_TIME, reverse=True)
     return grouped
 
 
-def _order_spectra(grouped: Mapping[str, deque[ArticleCapsule]]) -> List[str]:
-    if not grouped:
-        return []
-    ordering = sorted(
-        grouped.keys(),
-        key=lambda spectrum: grouped[spectrum][0].reference_time if grouped[spectrum] else datetime.min,
-        reverse=True,
-    )
-    return ordering
-
-
 def _assemble_distribution(event: Event, capsules: Sequence[ArticleCapsule]) -> Mapping[str, int]:
     distribution: dict[str, int] = {}
     if event.spectrum_distribution and isinstance(event.spectrum_distribution, Mapping):
@@ -681,4 +881,10 @@ def _assemble_distribution(event: Event, capsules: Sequence[ArticleCapsule]) ->
     return distribution
 
 
-__all__ = ["KeywordPromptResult", "PromptBuilder", "PromptBuilderError", "PromptGenerationResult"]
+__all__ = [
+    "KeywordPromptResult",
+    "PromptBuilder",
+    "PromptBuilderError",
+    "PromptGenerationResult",
+    "clear_prompt_cache",
+]
@@ -2,241 +2,267 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import re
+import sys
+from typing import Annotated, Literal, TypeVar
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints
 
-SpectrumLabel = Literal["mainstream", "links", "rechts", "alternatief", "overheid", "sociale_media"]
+# English spectrum labels the LLM sometimes emits, mapped to the Dutch vocabulary.
+_SPECTRUM_ALIASES = {
+    "center": "mainstream",
+    "centre": "mainstream",
+    "center-right": "mainstream",
+    "center-left": "mainstream",
+    "centre-right": "mainstream",
+    "centre-left": "mainstream",
+    "left": "links",
+    "left-wing": "links",
+    "right": "rechts",
+    "right-wing": "rechts",
+    "alternative": "alternatief",
+    "government": "overheid",
+    "social media": "sociale_media",
+    "social_media": "sociale_media",
+}
+
+
+def _normalize_spectrum(value: object) -> object:
+    if isinstance(value, str):
+        return _SPECTRUM_ALIASES.get(value.lower(), value)
+    return value
+
+
+def _none_to_empty(value: object) -> object:
+    return "" if value is None else value
+
+
+def _none_to_zero(value: object) -> object:
+    return 0 if value is None else value
+
+
+def _none_to_empty_list(value: object) -> object:
+    return [] if value is None else value
+
+
+_ISO_ALPHA2_RE = re.compile(r"[A-Z]{2}")
+
+
+def _check_iso_alpha2(value: str) -> str:
+    if not _ISO_ALPHA2_RE.fullmatch(value):
+        raise ValueError("expected an ISO 3166-1 alpha-2 code")
+    return value
+
+
+# LLMs often answer null for optional text; accept it as the empty default.
+NoneAsEmpty = Annotated[str, BeforeValidator(_none_to_empty)]
+NoneAsZero = Annotated[int, BeforeValidator(_none_to_zero)]
+_T = TypeVar("_T")
+NoneAsEmptyList = Annotated[list[_T], BeforeValidator(_none_to_empty_list)]
+
+
+# Upper bound for the top-level analysis lists; far above what a well-formed answer
+# contains, it makes runaway LLM output fail validation early.
+MAX_LLM_LIST_ITEMS = 200
+
+
+class _LLMSchema(BaseModel):
+    """Base for LLM payload schemas.
+
+    Validators are built on first use, not at import. Instances are read-only once
+    validated, which also keeps children shared between merged payloads safe.
+    Validation errors omit the (often very large) raw LLM input; callers log a
+    truncated copy of the response themselves.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, hide_input_in_errors=True)
+
+
+# Source URLs stay plain strings: a prefix/length check instead of building a Url object
+# for every link the LLM cites. Interned, so a URL cited in every section is stored once.
+UrlStr = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=2048, pattern=r"(?i)^https?://"),
+    AfterValidator(sys.intern),
+]
+
+SpectrumLabel = Annotated[
+    Literal["mainstream", "links", "rechts", "alternatief", "overheid", "sociale_media"],
+    BeforeValidator(_normalize_spectrum),
+]
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+IsoAlpha2 = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_upper=True),
+    AfterValidator(_check_iso_alpha2),
+]
+SpectrumName = Annotated[NonEmptyStr, BeforeValidator(_normalize_spectrum)]
 ClaimPresentation = Literal["feit", "advies", "mening", "voorspelling"]
 
 
-class InvolvedCountry(BaseModel):
+class InvolvedCountry(_LLMSchema):
     """A country involved in the news event, detected by LLM analysis."""
 
-    iso_code: str = Field(
+    iso_code: IsoAlpha2 = Field(
         ...,
-        min_length=2,
-        max_length=2,
         description="ISO 3166-1 alpha-2 country code (e.g., 'US', 'IL', 'RU')"
     )
-    name: str = Field(..., min_length=1, description="Full country name in English")
-    relevance: str = Field(
+    name: NonEmptyStr = Field(..., description="Full country name in English")
+    relevance: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Brief explanation of how this country is involved"
     )
 
 
-class InsightTimelineItem(BaseModel):
+class InsightTimelineItem(_LLMSchema):
     time: str = Field(..., description="Event moment: year (1934), date (2025-12-28), or ISO-8601 datetime")
-    headline: str = Field(..., min_length=1)
-    sources: list[HttpUrl] = Field(default_factory=list)
+    headline: NonEmptyStr = Field(...)
+    sources: tuple[UrlStr, ...] = Field(default=())
     spectrum: SpectrumLabel
 
 
-class InsightClusterSource(BaseModel):
-    title: str = Field(..., min_length=1)
-    url: HttpUrl
-    spectrum: str = Field(..., min_length=1)
+class InsightClusterSource(_LLMSchema):
+    title: NonEmptyStr = Field(...)
+    url: UrlStr
+    spectrum: SpectrumName = Field(...)
     stance: str = Field(default="", description="Short stance description")
 
 
-class InsightCluster(BaseModel):
-    label: str = Field(..., min_length=1)
+class InsightCluster(_LLMSchema):
+    label: NonEmptyStr = Field(...)
     spectrum: SpectrumLabel
     source_types: list[str] = Field(default_factory=list)
-    summary: str = Field(..., min_length=1)
+    summary: NonEmptyStr = Field(...)
     characteristics: list[str] = Field(default_factory=list)
     sources: list[InsightClusterSource] = Field(default_factory=list)
 
 
-class InsightContradictionClaim(BaseModel):
-    summary: str = Field(..., min_length=1)
-    sources: list[HttpUrl] = Field(default_factory=list)
-    spectrum: str = Field(..., min_length=1)
+class InsightContradictionClaim(_LLMSchema):
+    summary: NonEmptyStr = Field(...)
+    sources: tuple[UrlStr, ...] = Field(default=())
+    spectrum: SpectrumName = Field(...)
 
 
-class InsightContradiction(BaseModel):
-    topic: str = Field(..., min_length=1)
+class InsightContradiction(_LLMSchema):
+    topic: NonEmptyStr = Field(...)
     claim_a: InsightContradictionClaim
     claim_b: InsightContradictionClaim
     verification: Literal["onbevestigd", "bevestigd", "tegengesproken"]
 
 
-class InsightFallacy(BaseModel):
-    type: str = Field(..., min_length=1)
-    description: str = Field(..., min_length=1)
-    sources: list[HttpUrl] = Field(default_factory=list)
-    spectrum: str = Field(..., min_length=1)
+class InsightFallacy(_LLMSchema):
+    type: NonEmptyStr = Field(...)
+    description: NonEmptyStr = Field(...)
+    sources: tuple[UrlStr, ...] = Field(default=())
+    spectrum: SpectrumName = Field(...)
 
 
 FrameAttribution = Literal["eigen_framing", "geciteerd"]
 
 
-class InsightFrame(BaseModel):
+class InsightFrame(_LLMSchema):
     """Represents a framing technique used in news coverage (academic/NLP frames)."""
 
-    frame_type: str = Field(
+    frame_type: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Frame type from: conflict, human_interest, economisch, moraliteit, verantwoordelijkheid, veiligheid, metafoor, eufemisme, hyperbool, strategisch"
     )
     technique: str = Field(
         default="",
         description="Specific technique used (e.g., the exact metaphor, euphemism, or strategic word choice)"
     )
-    description: str = Field(..., min_length=1, description="How this frame/technique is applied and its effect on the reader")
-    sources: list[HttpUrl] = Field(default_factory=list, description="Articles using this frame - ONLY sources that use this framing themselves, not sources that quote others using it")
-    spectrum: str = Field(..., min_length=1, description="Media spectrum of sources using this frame")
+    description: NonEmptyStr = Field(..., description="How this frame/technique is applied and its effect on the reader")
+    sources: tuple[UrlStr, ...] = Field(default=(), description="Articles using this frame - ONLY sources that use this framing themselves, not sources that quote others using it")
+    spectrum: SpectrumName = Field(..., description="Media spectrum of sources using this frame")
     attribution: FrameAttribution | None = Field(
         default=None,
         description="eigen_framing = media outlet uses this framing itself; geciteerd = media is reporting what others say"
     )
 
 
-class CoverageGap(BaseModel):
+class CoverageGap(_LLMSchema):
     """Represents an underrepresented perspective or missing context in news coverage."""
 
-    perspective: str = Field(..., min_length=1, description="Name/label of the missing perspective")
-    description: str = Field(..., min_length=1, description="Explanation of what viewpoint or context is missing")
-    relevance: str = Field(..., min_length=1, description="Why this perspective matters for understanding the event")
+    perspective: NonEmptyStr = Field(..., description="Name/label of the missing perspective")
+    description: NonEmptyStr = Field(..., description="Explanation of what viewpoint or context is missing")
+    relevance: NonEmptyStr = Field(..., description="Why this perspective matters for understanding the event")
     potential_sources: list[str] = Field(default_factory=list, description="Types of sources that might provide this perspective")
 
 
 # === NIEUWE KRITISCHE ANALYSE SECTIES ===
 
 
-class UnsubstantiatedClaim(BaseModel):
+class UnsubstantiatedClaim(_LLMSchema):
     """Een claim die als feit wordt gepresenteerd zonder adequate onderbouwing."""
 
-    claim: str = Field(..., min_length=1, description="De letterlijke claim uit het artikel")
+    claim: NonEmptyStr = Field(..., description="De letterlijke claim uit het artikel")
     presented_as: str = Field(..., description="Hoe de claim wordt gepresenteerd: feit, advies, mening, voorspelling")
-    source_in_article: str = Field(..., min_length=1, description="Wie maakt deze claim in het artikel")
-    article_url: HttpUrl | None = Field(default=None, description="URL van het artikel waarin deze claim voorkomt")
+    source_in_article: NonEmptyStr = Field(..., description="Wie maakt deze claim in het artikel")
+    article_url: UrlStr | None = Field(default=None, description="URL van het artikel waarin deze claim voorkomt")
     evidence_provided: str = Field(..., description="Welk bewijs wordt aangedragen (of 'geen')")
     missing_context: list[str] = Field(default_factory=list, description="Welke context ontbreekt")
     critical_questions: list[str] = Field(default_factory=list, description="Vragen die een kritische journalist zou stellen")
 
 
-class AuthorityAnalysis(BaseModel):
+class AuthorityAnalysis(_LLMSchema):
     """Kritische analyse van een geciteerde autoriteit."""
 
-    authority: str = Field(..., min_length=1, description="Naam van de autoriteit/organisatie")
+    authority: NonEmptyStr = Field(..., description="Naam van de autoriteit/organisatie")
     authority_type: str = Field(..., description="Beschrijf accuraat - vermijd generieke labels")
-    article_url: HttpUrl | None = Field(default=None, description="URL van het artikel waarin deze autoriteit wordt geciteerd")
-    claimed_expertise: str = Field(..., min_length=1, description="Op welk terrein claimen zij expertise")
-    actual_role: str = Field(default="", description="Wat doen/zijn ze daadwerkelijk")
-    scope_creep: str = Field(default="", description="Adviseert buiten mandaat? Bijv. gezondheidsexpert over economie")
-    composition_question: str = Field(default="", description="Voor adviesorganen: wie benoemt leden? Welke achtergronden en standpunten zijn vertegenwoordigd? Is er ideologische diversiteit?")
-    funding_sources: str = Field(default="", description="Wie financiert dit instituut/deze expert?")
-    track_record: str = Field(default="", description="Eerdere uitspraken/adviezen en hoe die uitpakten")
+    article_url: UrlStr | None = Field(default=None, description="URL van het artikel waarin deze autoriteit wordt geciteerd")
+    claimed_expertise: NonEmptyStr = Field(..., description="Op welk terrein claimen zij expertise")
+    actual_role: NoneAsEmpty = Field(default="", description="Wat doen/zijn ze daadwerkelijk")
+    scope_creep: NoneAsEmpty = Field(default="", description="Adviseert buiten mandaat? Bijv. gezondheidsexpert over economie")
+    composition_question: NoneAsEmpty = Field(default="", description="Voor adviesorganen: wie benoemt leden? Welke achtergronden en standpunten zijn vertegenwoordigd? Is er ideologische diversiteit?")
+    funding_sources: NoneAsEmpty = Field(default="", description="Wie financiert dit instituut/deze expert?")
+    track_record: NoneAsEmpty = Field(default="", description="Eerdere uitspraken/adviezen en hoe die uitpakten")
     potential_interests: list[str] = Field(default_factory=list, description="Financiële, politieke, reputationele belangen")
-    independence_check: str = Field(default="", description="Onafhankelijk van wie? Gefinancierd door wie?")
+    independence_check: NoneAsEmpty = Field(default="", description="Onafhankelijk van wie? Gefinancierd door wie?")
     critical_questions: list[str] = Field(default_factory=list, description="Sceptische vragen bij deze autoriteit")
 
-    @model_validator(mode="before")
-    @classmethod
-    def convert_nulls_to_empty_strings(cls, data: dict) -> dict:
-        """Convert null values to empty strings for optional string fields."""
-        if isinstance(data, dict):
-            nullable_fields = [
-                "actual_role", "scope_creep", "composition_question",
-                "funding_sources", "track_record", "independence_check"
-            ]
-            for field in nullable_fields:
-                if field in data and data[field] is None:
-                    data[field] = ""
-        return data
-
-
-class MediaAnalysis(BaseModel):
+
+class MediaAnalysis(_LLMSchema):
     """Kritische analyse van de berichtgeving zelf."""
 
-    source: str = Field(..., min_length=1, description="Naam van het medium")
-    article_url: HttpUrl | None = Field(default=None, description="URL van het specifieke artikel dat wordt geanalyseerd")
-    tone: str = Field(..., min_length=1, description="Toon: feitelijk, kritisch, sensationeel, alarmerend, geruststellend, activistisch")
-    sourcing_pattern: str = Field(default="", description="Wie citeren ze? Wie niet?")
+    source: NonEmptyStr = Field(..., description="Naam van het medium")
+    article_url: UrlStr | None = Field(default=None, description="URL van het specifieke artikel dat wordt geanalyseerd")
+    tone: NonEmptyStr = Field(..., description="Toon: feitelijk, kritisch, sensationeel, alarmerend, geruststellend, activistisch")
+    sourcing_pattern: NoneAsEmpty = Field(default="", description="Wie citeren ze? Wie niet?")
     questions_not_asked: list[str] = Field(default_factory=list, description="Belangrijke vragen die de journalist niet stelde")
     perspectives_omitted: list[str] = Field(default_factory=list, description="Weggelaten perspectieven")
-    framing_by_omission: str = Field(default="", description="Hoe weglating de framing beïnvloedt")
-    copy_paste_score: str = Field(default="", description="Mate van kopie van persberichten/andere media (hoog/middel/laag)")
-    anonymous_source_count: int = Field(default=0, description="Aantal anonieme bronnen in dit artikel")
-    narrative_alignment: str = Field(default="", description="Past dit bij een bepaald narratief of agenda?")
-    what_if_wrong: str = Field(default="", description="Wat zijn de gevolgen als hun framing fout is?")
+    framing_by_omission: NoneAsEmpty = Field(default="", description="Hoe weglating de framing beïnvloedt")
+    copy_paste_score: NoneAsEmpty = Field(default="", description="Mate van kopie van persberichten/andere media (hoog/middel/laag)")
+    anonymous_source_count: NoneAsZero = Field(default=0, description="Aantal anonieme bronnen in dit artikel")
+    narrative_alignment: NoneAsEmpty = Field(default="", description="Past dit bij een bepaald narratief of agenda?")
+    what_if_wrong: NoneAsEmpty = Field(default="", description="Wat zijn de gevolgen als hun framing fout is?")
 
-    @model_validator(mode="before")
-    @classmethod
-    def convert_nulls_to_empty_strings(cls, data: dict) -> dict:
-        """Convert null values to empty strings for optional string fields."""
-        if isinstance(data, dict):
-            nullable_fields = [
-                "sourcing_pattern", "framing_by_omission", "copy_paste_score",
-                "narrative_alignment", "what_if_wrong"
-            ]
-            for field in nullable_fields:
-                if field in data and data[field] is None:
-                    data[field] = ""
-            # Handle anonymous_source_count being null
-            if "anonymous_source_count" in data and data["anonymous_source_count"] is None:
-                data["anonymous_source_count"] = 0
-        return data
-
-
-class ScientificPlurality(BaseModel):
+
+class ScientificPlurality(_LLMSchema):
     """Analyse van wetenschappelijke pluraliteit bij claims met wetenschappelijke onderbouwing."""
 
-    topic: str = Field(..., min_length=1, description="Het wetenschappelijke onderwerp")
-    presented_view: str = Field(..., min_length=1, description="De gepresenteerde wetenschappelijke visie")
+    topic: NonEmptyStr = Field(..., description="Het wetenschappelijke onderwerp")
+    presented_view: NonEmptyStr = Field(..., description="De gepresenteerde wetenschappelijke visie")
     alternative_views_mentioned: bool = Field(..., description="Worden alternatieve visies genoemd?")
     known_debates: list[str] = Field(default_factory=list, description="Bekende wetenschappelijke debatten over dit onderwerp")
-    notable_dissenters: str = Field(default="", description="Bekende wetenschappers met afwijkende mening")
-    assessment: str = Field(..., min_length=1, description="Beoordeling van de pluraliteit in de berichtgeving")
-
-    @model_validator(mode="before")
-    @classmethod
-    def convert_nulls(cls, data: dict) -> dict:
-        """Convert null values to appropriate defaults."""
-        if isinstance(data, dict):
-            if "notable_dissenters" in data and data["notable_dissenters"] is None:
-                data["notable_dissenters"] = ""
-        return data
+    notable_dissenters: NoneAsEmpty = Field(default="", description="Bekende wetenschappers met afwijkende mening")
+    assessment: NonEmptyStr = Field(..., description="Beoordeling van de pluraliteit in de berichtgeving")
 
 
-class StatisticalIssue(BaseModel):
+class StatisticalIssue(_LLMSchema):
     """Een misleidende of onjuist gepresenteerde statistiek."""
 
-    claim: str = Field(..., min_length=1, description="De statistische claim uit het artikel")
-    article_url: HttpUrl | None = Field(default=None, description="URL van het artikel met deze statistiek")
-    issue: str = Field(..., min_length=1, description="Wat er misleidend aan is")
-    better_framing: str = Field(default="", description="Hoe het beter gepresenteerd zou kunnen worden")
+    claim: NonEmptyStr = Field(..., description="De statistische claim uit het artikel")
+    article_url: UrlStr | None = Field(default=None, description="URL van het artikel met deze statistiek")
+    issue: NonEmptyStr = Field(..., description="Wat er misleidend aan is")
+    better_framing: NoneAsEmpty = Field(default="", description="Hoe het beter gepresenteerd zou kunnen worden")
 
-    @model_validator(mode="before")
-    @classmethod
-    def convert_nulls(cls, data: dict) -> dict:
-        """Convert null values to appropriate defaults."""
-        if isinstance(data, dict):
-            if "better_framing" in data and data["better_framing"] is None:
-                data["better_framing"] = ""
-        return data
 
-
-class TimingAnalysis(BaseModel):
+class TimingAnalysis(_LLMSchema):
     """Analyse van de timing van het nieuwsbericht."""
 
-    why_now: str = Field(..., min_length=1, description="Waarom is dit nu nieuws?")
-    cui_bono: str = Field(default="", description="Wie profiteert van deze timing?")
-    upcoming_events: str = Field(default="", description="Relevante aankomende beslissingen of gebeurtenissen")
-
-    @model_validator(mode="before")
-    @classmethod
-    def convert_nulls(cls, data: dict) -> dict:
-        """Convert null values to appropriate defaults."""
-        if isinstance(data, dict):
-            nullable_fields = ["cui_bono", "upcoming_events"]
-            for field in nullable_fields:
-                if field in data and data[field] is None:
-                    data[field] = ""
-        return data
+    why_now: NonEmptyStr = Field(..., description="Waarom is dit nu nieuws?")
+    cui_bono: NoneAsEmpty = Field(default="", description="Wie profiteert van deze timing?")
+    upcoming_events: NoneAsEmpty = Field(default="", description="Relevante aankomende beslissingen of gebeurtenissen")
 
 
 # === BIAS DETECTION SCHEMAS (Epic 10) ===
@@ -244,12 +270,12 @@ class TimingAnalysis(BaseModel):
 BiasSource = Literal["journalist", "framing", "quote_selection", "quote"]
 
 
-class SentenceBias(BaseModel):
+class SentenceBias(_LLMSchema):
     """A single sentence with detected bias."""
 
     sentence_index: int = Field(..., ge=0, description="0-based index of the sentence in the article")
-    sentence_text: str = Field(..., min_length=1, description="The exact sentence text from the article")
-    bias_type: str = Field(..., min_length=1, description="One of the 26 bias types")
+    sentence_text: NonEmptyStr = Field(..., description="The exact sentence text from the article")
+    bias_type: NonEmptyStr = Field(..., description="One of the 26 bias types")
     bias_source: BiasSource = Field(
         ...,
         description="journalist/framing/quote_selection count toward score; quote is informational only"
@@ -259,10 +285,10 @@ class SentenceBias(BaseModel):
         description="Name of the speaker if bias_source='quote'"
     )
     score: float = Field(..., ge=0.0, le=1.0, description="Severity of the bias (0-1)")
-    explanation: str = Field(..., min_length=1, description="Dutch explanation of why this is biased")
+    explanation: NonEmptyStr = Field(..., description="Dutch explanation of why this is biased")
 
 
-class BiasAnalysisSummary(BaseModel):
+class BiasAnalysisSummary(_LLMSchema):
     """Summary statistics for an article's bias analysis."""
 
     total_sentences: int = Field(..., ge=0)
@@ -279,27 +305,21 @@ class BiasAnalysisSummary(BaseModel):
     )
 
 
-class BiasAnalysisPayload(BaseModel):
+class BiasAnalysisPayload(_LLMSchema):
     """Complete bias analysis result from LLM."""
 
     total_sentences: int = Field(..., ge=0)
-    journalist_biases: list[SentenceBias] = Field(
+    journalist_biases: NoneAsEmptyList[SentenceBias] = Field(
         default_factory=list,
         description="Biases in journalist's own words/framing/selection (count toward score)"
     )
-    quote_biases: list[SentenceBias] = Field(
+    quote_biases: NoneAsEmptyList[SentenceBias] = Field(
         default_factory=list,
         description="Biases in quoted content (informational only, don't count)"
     )
 
-    @field_validator("journalist_biases", "quote_biases", mode="before")
-    @classmethod
-    def coerce_biases(cls, v: list | None) -> list:
-        """Convert null to empty list."""
-        return v if v is not None else []
-
 
-class KeywordExtractionPayload(BaseModel):
+class KeywordExtractionPayload(_LLMSchema):
     """Lightweight payload for keyword extraction phase (pre-enrichment)."""
 
     search_keywords: list[str] = Field(
@@ -313,13 +333,13 @@ class KeywordExtractionPayload(BaseModel):
     )
 
 
-class FactualPayload(BaseModel):
+class FactualPayload(_LLMSchema):
     """Phase 1: Factual analysis only."""
 
     summary: str = Field(..., min_length=100, description="Comprehensive narrative summary combining all articles")
-    timeline: list[InsightTimelineItem] = Field(default_factory=list)
-    clusters: list[InsightCluster] = Field(default_factory=list)
-    contradictions: list[InsightContradiction] = Field(default_factory=list)
+    timeline: list[InsightTimelineItem] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    clusters: list[InsightCluster] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    contradictions: list[InsightContradiction] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
     involved_countries: list[InvolvedCountry] = Field(
         default_factory=list,
         description="Countries involved in this news event (excluding NL/BE)"
@@ -331,31 +351,25 @@ class FactualPayload(BaseModel):
     )
 
 
-class CriticalPayload(BaseModel):
+class CriticalPayload(_LLMSchema):
     """Phase 2: Critical analysis only."""
 
-    fallacies: list[InsightFallacy] = Field(default_factory=list)
-    frames: list[InsightFrame] = Field(default_factory=list, description="Framing perspectives used in news coverage")
-    coverage_gaps: list[CoverageGap] = Field(default_factory=list, description="Underrepresented perspectives or missing contexts")
-    unsubstantiated_claims: list[UnsubstantiatedClaim] = Field(default_factory=list, description="Claims zonder adequate onderbouwing")
-    authority_analysis: list[AuthorityAnalysis] = Field(default_factory=list, description="Kritische analyse van geciteerde autoriteiten")
-    media_analysis: list[MediaAnalysis] = Field(default_factory=list, description="Kritische analyse van de berichtgeving zelf")
-    statistical_issues: list[StatisticalIssue] = Field(default_factory=list, description="Misleidende statistieken")
+    fallacies: list[InsightFallacy] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    frames: list[InsightFrame] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Framing perspectives used in news coverage")
+    coverage_gaps: list[CoverageGap] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Underrepresented perspectives or missing contexts")
+    unsubstantiated_claims: list[UnsubstantiatedClaim] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Claims zonder adequate onderbouwing")
+    authority_analysis: list[AuthorityAnalysis] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Kritische analyse van geciteerde autoriteiten")
+    media_analysis: list[MediaAnalysis] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Kritische analyse van de berichtgeving zelf")
+    statistical_issues: NoneAsEmptyList[StatisticalIssue] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Misleidende statistieken")
     timing_analysis: TimingAnalysis | None = Field(default=None, description="Analyse van de timing van het nieuwsbericht")
     scientific_plurality: ScientificPlurality | None = Field(default=None, description="Analyse van wetenschappelijke pluraliteit")
 
-    @field_validator("statistical_issues", mode="before")
-    @classmethod
-    def coerce_statistical_issues(cls, v: list | None) -> list:
-        """Convert null to empty list for statistical_issues."""
-        return v if v is not None else []
-
 
-class InsightsPayload(BaseModel):
+class InsightsPayload(_LLMSchema):
     summary: str = Field(..., min_length=100, description="Comprehensive narrative summary combining all articles")
-    timeline: list[InsightTimelineItem] = Field(default_factory=list)
-    clusters: list[InsightCluster] = Field(default_factory=list)
-    contradictions: list[InsightContradiction] = Field(default_factory=list)
+    timeline: list[InsightTimelineItem] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    clusters: list[InsightCluster] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    contradictions: list[InsightContradiction] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
     involved_countries: list[InvolvedCountry] = Field(
         default_factory=list,
         description="Countries involved in this news event (excluding NL/BE)"
@@ -364,21 +378,27 @@ class InsightsPayload(BaseModel):
         default_factory=list,
         description="English keywords for international news search"
     )
-    fallacies: list[InsightFallacy] = Field(default_factory=list)
-    frames: list[InsightFrame] = Field(default_factory=list, description="Framing perspectives used in news coverage")
-    coverage_gaps: list[CoverageGap] = Field(default_factory=list, description="Underrepresented perspectives or missing contexts")
+    fallacies: list[InsightFallacy] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS)
+    frames: list[InsightFrame] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Framing perspectives used in news coverage")
+    coverage_gaps: list[CoverageGap] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Underrepresented perspectives or missing contexts")
     # Kritische analyse secties
-    unsubstantiated_claims: list[UnsubstantiatedClaim] = Field(default_factory=list, description="Claims zonder adequate onderbouwing")
-    authority_analysis: list[AuthorityAnalysis] = Field(default_factory=list, description="Kritische analyse van geciteerde autoriteiten")
-    media_analysis: list[MediaAnalysis] = Field(default_factory=list, description="Kritische analyse van de berichtgeving zelf")
-    statistical_issues: list[StatisticalIssue] = Field(default_factory=list, description="Misleidende statistieken")
+    unsubstantiated_claims: list[UnsubstantiatedClaim] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Claims zonder adequate onderbouwing")
+    authority_analysis: list[AuthorityAnalysis] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Kritische analyse van geciteerde autoriteiten")
+    media_analysis: list[MediaAnalysis] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Kritische analyse van de berichtgeving zelf")
+    statistical_issues: list[StatisticalIssue] = Field(default_factory=list, max_length=MAX_LLM_LIST_ITEMS, description="Misleidende statistieken")
     timing_analysis: TimingAnalysis | None = Field(default=None, description="Analyse van de timing van het nieuwsbericht")
     scientific_plurality: ScientificPlurality | None = Field(default=None, description="Analyse van wetenschappelijke pluraliteit")
 
     @classmethod
     def from_phases(cls, factual: FactualPayload, critical: CriticalPayload) -> InsightsPayload:
-        """Merge factual and critical payloads into a complete InsightsPayload."""
-        return cls(
+        """Merge factual and critical payloads into a complete InsightsPayload.
+
+        Both phases are validated when parsed and carry every constraint this model
+        has, so the merge uses ``model_construct`` and shares their children by
+        reference instead of re-validating the whole tree. Inputs must be validated
+        payloads.
+        """
+        return cls.model_construct(
             summary=factual.summary,
             timeline=factual.timeline,
             clusters=factual.clusters,
@@ -416,12 +436,20 @@ __all__ = [
     "InsightTimelineItem",
     "InsightsPayload",
     "InvolvedCountry",
+    "IsoAlpha2",
     "KeywordExtractionPayload",
+    "MAX_LLM_LIST_ITEMS",
     "MediaAnalysis",
+    "NonEmptyStr",
+    "NoneAsEmpty",
+    "NoneAsEmptyList",
+    "NoneAsZero",
     "ScientificPlurality",
     "SentenceBias",
     "SpectrumLabel",
+    "SpectrumName",
     "StatisticalIssue",
     "TimingAnalysis",
     "UnsubstantiatedClaim",
+    "UrlStr",
 ]
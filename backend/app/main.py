@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.core.config import get_settings
-from backend.app.core.logging import configure_logging
+from backend.app.core.logging import configure_logging, get_logger
 from backend.app.core.scheduler import get_scheduler
 from backend.app.db.session import init_db
+from backend.app.nlp import get_spacy_model
 from backend.app.routers import (
     aggregate_router,
     bias_router,
@@ -19,13 +21,22 @@ from backend.app.routers import (
 from backend.app.routers.admin import router as admin_router
 from backend.app.routers.health import router as health_router
 
+logger = get_logger(__name__)
+
+# Local frontend dev servers; deployment origins come from FRONTEND_ORIGINS.
+_DEV_ORIGINS = (
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3001",
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle (startup and shutdown)."""
     # Startup
     # Configure logging with rotating file handler (Story 5.1)
-    settings = get_settings()
     configure_logging(
         log_level=settings.log_level,
         json_format=False,  # Use console format for development
@@ -35,6 +46,12 @@ async def lifespan(app: FastAPI):
     # Initialize database tables
     await init_db()
 
+    # Load spaCy off the event loop now, so the first enrichment run doesn't stall it
+    try:
+        await asyncio.to_thread(get_spacy_model)
+    except RuntimeError as exc:
+        logger.warning("spacy_preload_failed", error=str(exc))
+
     scheduler = get_scheduler()
     scheduler.start()
     yield
@@ -48,12 +65,7 @@ settings = get_settings()
 # Always enable CORS for development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "http://localhost:3001",
-        "http://127.0.0.1:3001",
-    ] + settings.allowed_origins,
+    allow_origins=[*_DEV_ORIGINS, *settings.allowed_origins],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
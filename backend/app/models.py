@@ -1,70 +1,80 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 
-class TavilyArticle(BaseModel):
+class _Model(BaseModel):
+    """Base for the API models: validators are built on first use, not at import."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+# Article URLs stay plain strings: a scheme check instead of a full URL parse per article.
+HttpUrlStr = Annotated[str, StringConstraints(strip_whitespace=True, pattern=r"(?i)^https?://")]
+
+
+class TavilyArticle(_Model):
     title: str
-    url: HttpUrl
-    snippet: Optional[str] = None
-    published_time: Optional[datetime] = None
+    url: HttpUrlStr
+    snippet: str | None = None
+    published_time: datetime | None = None
 
 
-class Article(BaseModel):
+class Article(_Model):
     title: str
-    url: HttpUrl
+    url: HttpUrlStr
     text: str = Field(..., description="Extracted article text")
-    snippet: Optional[str] = None
-    published_time: Optional[datetime] = None
+    snippet: str | None = None
+    published_time: datetime | None = None
 
 
-class TimelineEvent(BaseModel):
+class TimelineEvent(_Model):
     time: str
     headline: str
-    sources: List[str]
-    spectrum: Optional[str] = None
+    sources: list[str]
+    spectrum: str | None = None
 
 
-class ClusterSource(BaseModel):
+class ClusterSource(_Model):
     title: str
-    url: str  # Changed from HttpUrl to str to avoid validation issues
-    spectrum: Optional[str] = None
-    stance: Optional[str] = None
+    url: str
+    spectrum: str | None = None
+    stance: str | None = None
 
 
-class Cluster(BaseModel):
+class Cluster(_Model):
     label: str
-    spectrum: Optional[str] = None
-    source_types: Optional[List[str]] = None
+    spectrum: str | None = None
+    source_types: list[str] | None = None
     summary: str
-    characteristics: Optional[List[str]] = None
-    sources: List[ClusterSource]
+    characteristics: list[str] | None = None
+    sources: list[ClusterSource]
 
 
-class Fallacy(BaseModel):
+class Fallacy(_Model):
     type: str
     description: str
-    sources: List[str]
-    spectrum: Optional[str] = None
+    sources: list[str]
+    spectrum: str | None = None
 
 
-class Frame(BaseModel):
+class Frame(_Model):
     frame_type: str
     description: str
-    sources: List[str]
-    spectrum: Optional[str] = None
+    sources: list[str]
+    spectrum: str | None = None
 
 
-class ContradictionClaim(BaseModel):
+class ContradictionClaim(_Model):
     summary: str
-    sources: List[str]
-    spectrum: Optional[str] = None
+    sources: list[str]
+    spectrum: str | None = None
 
 
-class Contradiction(BaseModel):
+class Contradiction(_Model):
     topic: str
     claim_a: ContradictionClaim
     claim_b: ContradictionClaim
@@ -73,196 +83,205 @@ class Contradiction(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class CoverageGap(BaseModel):
+class CoverageGap(_Model):
     perspective: str
     description: str
     relevance: str
-    potential_sources: List[str]
+    potential_sources: list[str]
 
 
 # Kritische analyse types
-class UnsubstantiatedClaim(BaseModel):
+class UnsubstantiatedClaim(_Model):
     claim: str
     presented_as: str
     source_in_article: str
     evidence_provided: str
-    missing_context: List[str] = Field(default_factory=list)
-    critical_questions: List[str] = Field(default_factory=list)
+    missing_context: tuple[str, ...] = ()
+    critical_questions: tuple[str, ...] = ()
 
 
-class AuthorityAnalysis(BaseModel):
+class AuthorityAnalysis(_Model):
     authority: str
     authority_type: str
     claimed_expertise: str
-    actual_role: Optional[str] = None
-    scope_creep: Optional[str] = None
-    composition_question: Optional[str] = None
-    funding_sources: Optional[str] = None
-    track_record: Optional[str] = None
-    potential_interests: List[str] = Field(default_factory=list)
-    independence_check: Optional[str] = None
-    critical_questions: List[str] = Field(default_factory=list)
+    actual_role: str | None = None
+    scope_creep: str | None = None
+    composition_question: str | None = None
+    funding_sources: str | None = None
+    track_record: str | None = None
+    potential_interests: tuple[str, ...] = ()
+    independence_check: str | None = None
+    critical_questions: tuple[str, ...] = ()
 
 
-class MediaAnalysis(BaseModel):
+class MediaAnalysis(_Model):
     source: str
     tone: str
-    sourcing_pattern: Optional[str] = None
-    questions_not_asked: List[str] = Field(default_factory=list)
-    perspectives_omitted: List[str] = Field(default_factory=list)
-    framing_by_omission: Optional[str] = None
-    copy_paste_score: Optional[str] = None
-    anonymous_source_count: Optional[int] = None
-    narrative_alignment: Optional[str] = None
-    what_if_wrong: Optional[str] = None
+    sourcing_pattern: str | None = None
+    questions_not_asked: tuple[str, ...] = ()
+    perspectives_omitted: tuple[str, ...] = ()
+    framing_by_omission: str | None = None
+    copy_paste_score: str | None = None
+    anonymous_source_count: int | None = None
+    narrative_alignment: str | None = None
+    what_if_wrong: str | None = None
 
 
-class StatisticalIssue(BaseModel):
+class StatisticalIssue(_Model):
     claim: str
     issue: str
-    better_framing: Optional[str] = None
+    better_framing: str | None = None
 
 
-class TimingAnalysis(BaseModel):
+class TimingAnalysis(_Model):
     why_now: str
-    cui_bono: Optional[str] = None
-    upcoming_events: Optional[str] = None
+    cui_bono: str | None = None
+    upcoming_events: str | None = None
 
 
-class ScientificPlurality(BaseModel):
+class ScientificPlurality(_Model):
     topic: str
     presented_view: str
     alternative_views_mentioned: bool
-    known_debates: List[str] = Field(default_factory=list)
+    known_debates: tuple[str, ...] = ()
     notable_dissenters: str
     assessment: str
 
 
-class AggregationResponse(BaseModel):
+class AggregationResponse(_Model):
     query: str
     generated_at: datetime
-    llm_provider: Optional[str] = None
-    summary: Optional[str] = None
-    timeline: List[TimelineEvent]
-    clusters: List[Cluster]
-    fallacies: List[Fallacy]
-    frames: List[Frame]
-    contradictions: List[Contradiction]
-    coverage_gaps: List[CoverageGap] = Field(default_factory=list)
+    llm_provider: str | None = None
+    summary: str | None = None
+    timeline: list[TimelineEvent]
+    clusters: list[Cluster]
+    fallacies: list[Fallacy]
+    frames: list[Frame]
+    contradictions: list[Contradiction]
+    coverage_gaps: tuple[CoverageGap, ...] = ()
     # Kritische analyse
-    unsubstantiated_claims: List[UnsubstantiatedClaim] = Field(default_factory=list)
-    authority_analysis: List[AuthorityAnalysis] = Field(default_factory=list)
-    media_analysis: List[MediaAnalysis] = Field(default_factory=list)
-    statistical_issues: List[StatisticalIssue] = Field(default_factory=list)
-    timing_analysis: Optional[TimingAnalysis] = None
-    scientific_plurality: Optional[ScientificPlurality] = None
+    unsubstantiated_claims: tuple[UnsubstantiatedClaim, ...] = ()
+    authority_analysis: tuple[AuthorityAnalysis, ...] = ()
+    media_analysis: tuple[MediaAnalysis, ...] = ()
+    statistical_issues: tuple[StatisticalIssue, ...] = ()
+    timing_analysis: TimingAnalysis | None = None
+    scientific_plurality: ScientificPlurality | None = None
 
 
-class AggregateRequest(BaseModel):
+class AggregateRequest(_Model):
     query: str
-    max_results: Optional[int] = Field(default=None, ge=1, le=20)
+    max_results: int | None = Field(default=None, ge=1, le=20)
 
 
 # REST API Response Models for Events and Insights
 
-class EventSourceBreakdownEntry(BaseModel):
+class _TrustedResponse(_Model):
+    """Response model that routers may build from already-typed DB data without validation."""
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Construct without validation; only for values read from our own database."""
+        return cls.model_construct(_fields_set=set(data), **data)
+
+
+class EventSourceBreakdownEntry(_Model):
     source: str
     article_count: int
-    spectrum: Optional[str] = None
+    spectrum: str | None = None
 
 
-class EventArticleResponse(BaseModel):
+class EventArticleResponse(_TrustedResponse):
     id: int
     title: str
     url: str
     source: str
-    spectrum: Optional[str] = None
-    published_at: Optional[datetime] = None
-    summary: Optional[str] = None
-    image_url: Optional[str] = None
+    spectrum: str | None = None
+    published_at: datetime | None = None
+    summary: str | None = None
+    image_url: str | None = None
 
 
-class EventListItem(BaseModel):
+class EventListItem(_TrustedResponse):
     id: int
-    slug: Optional[str] = None
+    slug: str | None = None
     title: str
-    description: Optional[str] = None
-    summary: Optional[str] = None
-    first_seen_at: Optional[datetime] = None
-    last_updated_at: Optional[datetime] = None
+    description: str | None = None
+    summary: str | None = None
+    first_seen_at: datetime | None = None
+    last_updated_at: datetime | None = None
     article_count: int
-    spectrum_distribution: Optional[dict] = None
-    source_breakdown: Optional[List[EventSourceBreakdownEntry]] = None
-    llm_provider: Optional[str] = None
-    featured_image_url: Optional[str] = None
+    spectrum_distribution: dict | None = None
+    source_breakdown: list[EventSourceBreakdownEntry] | None = None
+    llm_provider: str | None = None
+    featured_image_url: str | None = None
 
 
 class EventDetail(EventListItem):
-    articles: Optional[List[EventArticleResponse]] = None
-    insights_status: Optional[str] = None
-    insights_generated_at: Optional[datetime] = None
-    insights_requested_at: Optional[datetime] = None
-    keywords: Optional[List[str]] = None
+    articles: list[EventArticleResponse] | None = None
+    insights_status: str | None = None
+    insights_generated_at: datetime | None = None
+    insights_requested_at: datetime | None = None
+    keywords: list[str] | None = None
 
 
-class EventFeedMeta(BaseModel):
-    last_updated_at: Optional[datetime] = None
-    last_updated: Optional[datetime] = None
-    last_refresh_at: Optional[datetime] = None
-    generated_at: Optional[datetime] = None
-    llm_provider: Optional[str] = None
-    active_provider: Optional[str] = None
-    total_events: Optional[int] = None
-    event_count: Optional[int] = None
+class EventFeedMeta(_Model):
+    last_updated_at: datetime | None = None
+    last_updated: datetime | None = None
+    last_refresh_at: datetime | None = None
+    generated_at: datetime | None = None
+    llm_provider: str | None = None
+    active_provider: str | None = None
+    total_events: int | None = None
+    event_count: int | None = None
 
 
-class EventDetailMeta(BaseModel):
-    last_updated_at: Optional[datetime] = None
-    generated_at: Optional[datetime] = None
-    llm_provider: Optional[str] = None
-    insights_status: Optional[str] = None
-    insights_generated_at: Optional[datetime] = None
-    insights_requested_at: Optional[datetime] = None
-    first_seen_at: Optional[datetime] = None
+class EventDetailMeta(_Model):
+    last_updated_at: datetime | None = None
+    generated_at: datetime | None = None
+    llm_provider: str | None = None
+    insights_status: str | None = None
+    insights_generated_at: datetime | None = None
+    insights_requested_at: datetime | None = None
+    first_seen_at: datetime | None = None
 
 
-class ApiResponse(BaseModel):
-    data: List[EventListItem] | EventDetail | AggregationResponse
-    meta: Optional[EventFeedMeta | EventDetailMeta | dict] = None
-    links: Optional[dict] = None
+class ApiResponse(_Model):
+    data: list[EventListItem] | EventDetail | AggregationResponse
+    meta: EventFeedMeta | EventDetailMeta | dict | None = None
+    links: dict | None = None
 
 
 # Bias Analysis Response Models (Epic 10)
 
 
-class SentenceBiasResponse(BaseModel):
+class SentenceBiasResponse(_TrustedResponse):
     """A single sentence with detected bias."""
 
     sentence_index: int
     sentence_text: str
     bias_type: str
     bias_source: str  # "journalist", "framing", "quote_selection", or "quote"
-    speaker: Optional[str] = None  # Only for quote bias
+    speaker: str | None = None  # Only for quote bias
     score: float = Field(..., ge=0.0, le=1.0)
     explanation: str
 
 
-class BiasAnalysisSummary(BaseModel):
+class BiasAnalysisSummary(_Model):
     """Summary statistics for bias analysis."""
 
     total_sentences: int
     journalist_bias_count: int
     quote_bias_count: int
     journalist_bias_percentage: float
-    most_frequent_journalist_bias: Optional[str] = None
-    most_frequent_count: Optional[int] = None
-    average_journalist_bias_strength: Optional[float] = None
+    most_frequent_journalist_bias: str | None = None
+    most_frequent_count: int | None = None
+    average_journalist_bias_strength: float | None = None
     overall_journalist_rating: float = Field(
         ..., ge=0.0, le=1.0, description="Lower = more objective"
     )
 
 
-class ArticleBiasResponse(BaseModel):
+class ArticleBiasResponse(_TrustedResponse):
     """Full bias analysis response for a single article."""
 
     article_id: int
@@ -270,11 +289,11 @@ class ArticleBiasResponse(BaseModel):
     provider: str
     model: str
     summary: BiasAnalysisSummary
-    journalist_biases: List[SentenceBiasResponse]
-    quote_biases: List[SentenceBiasResponse]
+    journalist_biases: tuple[SentenceBiasResponse, ...]
+    quote_biases: tuple[SentenceBiasResponse, ...]
 
 
-class ArticleBiasResponseMeta(BaseModel):
+class ArticleBiasResponseMeta(_Model):
     """Metadata for article bias response."""
 
     article_id: int
@@ -283,7 +302,7 @@ class ArticleBiasResponseMeta(BaseModel):
     analyzed_at: datetime
 
 
-class SourceBiasStats(BaseModel):
+class SourceBiasStats(_Model):
     """Bias statistics for a single source within an event."""
 
     source: str
@@ -295,27 +314,27 @@ class SourceBiasStats(BaseModel):
     total_journalist_biases: int
 
 
-class BiasTypeCount(BaseModel):
+class BiasTypeCount(_Model):
     """Count of a specific bias type across event."""
 
     bias_type: str
     count: int
 
 
-class EventBiasSummary(BaseModel):
+class EventBiasSummary(_TrustedResponse):
     """Aggregated bias summary for an event."""
 
     event_id: int
     total_articles: int
     articles_analyzed: int
-    average_bias_rating: Optional[float] = Field(
+    average_bias_rating: float | None = Field(
         None, ge=0.0, le=1.0, description="Average across all analyzed articles"
     )
-    by_source: List[SourceBiasStats]
-    bias_type_distribution: List[BiasTypeCount]
+    by_source: list[SourceBiasStats]
+    bias_type_distribution: list[BiasTypeCount]
 
 
-class EventBiasSummaryMeta(BaseModel):
+class EventBiasSummaryMeta(_Model):
     """Metadata for event bias summary."""
 
     event_id: int
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from backend.app.llm.client import MistralClient
 
 from backend.app.core.logging import get_logger
-from backend.app.services.llm_config_service import get_llm_config_service
+from backend.app.services.llm_config_service import get_llm_config_service, load_default_template
 
 logger = get_logger(__name__)
 
@@ -24,6 +28,7 @@ VALID_EVENT_TYPES = [
     "weather",
     "other",
 ]
+_VALID_EVENT_TYPE_SET = frozenset(VALID_EVENT_TYPES)
 
 
 DEFAULT_CLASSIFICATION_PROMPT = """Classify this Dutch news article into ONE category.
@@ -47,6 +52,42 @@ Rules:
 Respond with ONLY the category name in lowercase, nothing else."""
 
 
+# Seeded into llm_config as prompt_classification_batch; {articles} receives the numbered list
+DEFAULT_BATCH_CLASSIFICATION_PROMPT = load_default_template("classification_batch_prompt.txt")
+
+# Articles per classification prompt, and how many such prompts may be in flight at once
+CLASSIFICATION_BATCH_SIZE = 20
+MAX_CONCURRENT_CLASSIFICATION_BATCHES = 3
+# In-flight single-article calls when articles are classified one by one
+MAX_CONCURRENT_CLASSIFICATIONS = 10
+
+# Model answers keyed by (title, content excerpt): wire copies republished by several
+# sources are classified once. LRU-bounded; only on-list answers are cached, so failed calls
+# and off-list answers that fell back to "other" are asked again next time.
+CLASSIFICATION_CACHE_SIZE = 4096
+_CLASSIFICATION_CACHE: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+# Title terms that only ever appear in one category; such articles skip the LLM call.
+# Kept to unambiguous names: club names or words like "storm" also occur in other news.
+_FAST_PATH_PATTERNS = (
+    (
+        re.compile(r"\b(?:KNMI|weeralarm|hittegolf|sneeuwval|windstoten)\b", re.IGNORECASE),
+        "weather",
+    ),
+    (
+        re.compile(
+            r"\b(?:Eredivisie|Keuken Kampioen Divisie|Champions League|Europa League"
+            r"|Conference League|Formule 1|Tour de France|Giro d'Italia|Vuelta|Oranjeleeuwinnen)\b",
+            re.IGNORECASE,
+        ),
+        "sports",
+    ),
+)
+
+_PLACEHOLDER_RE = re.compile(r"\{(title|content)\}")
+_BATCH_LINE_RE = re.compile(r"^\s*(\d+)\s*[.):-]?\s*([a-z_]+)", re.MULTILINE)
+
+
 async def _get_classification_prompt() -> str:
     """Load classification prompt from database, with fallback to default."""
     try:
@@ -59,6 +100,79 @@ async def _get_classification_prompt() -> str:
     return DEFAULT_CLASSIFICATION_PROMPT
 
 
+async def _get_batch_classification_prompt() -> str:
+    """Load batch classification prompt from database, with fallback to default."""
+    try:
+        config_service = get_llm_config_service()
+        db_value = await config_service.get_value("prompt_classification_batch")
+        if db_value and "{articles}" in db_value:
+            return db_value
+    except Exception as e:
+        logger.warning("batch_classification_prompt_db_load_failed", error=str(e))
+    return DEFAULT_BATCH_CLASSIFICATION_PROMPT.strip()
+
+
+def _fast_path_event_type(title: str, content: str | None) -> str | None:
+    """Return the category for articles that need no LLM call, else None."""
+    if not (title and title.strip()) and not (content and content.strip()):
+        return "other"
+    for pattern, event_type in _FAST_PATH_PATTERNS:
+        if pattern.search(title):
+            return event_type
+    return None
+
+
+def _cache_key(title: str, content: str | None) -> tuple[str, str]:
+    return title, content[:600] if content else ""
+
+
+def _cached_event_type(key: tuple[str, str]) -> str | None:
+    event_type = _CLASSIFICATION_CACHE.get(key)
+    if event_type is not None:
+        _CLASSIFICATION_CACHE.move_to_end(key)
+    return event_type
+
+
+def _remember_event_type(key: tuple[str, str], event_type: str) -> None:
+    _CLASSIFICATION_CACHE[key] = event_type
+    _CLASSIFICATION_CACHE.move_to_end(key)
+    if len(_CLASSIFICATION_CACHE) > CLASSIFICATION_CACHE_SIZE:
+        _CLASSIFICATION_CACHE.popitem(last=False)
+
+
+def clear_classification_cache() -> None:
+    """Drop remembered classifications (e.g. after the classification prompt changed)."""
+    _CLASSIFICATION_CACHE.clear()
+
+
+@lru_cache(maxsize=8)
+def _split_template(template: str) -> tuple[str, ...]:
+    """Split a prompt once into literal text (even indices) and placeholder names (odd)."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _render_prompt(template: str, values: dict[str, str]) -> str:
+    parts = _split_template(template)
+    return "".join(part if idx % 2 == 0 else values[part] for idx, part in enumerate(parts))
+
+
+def _parse_batch_classification(content: str, count: int) -> list[str | None]:
+    """Map numbered "<n>. <category>" lines to positions.
+
+    Positions without an answer or with an off-list category stay None, so the caller
+    classifies those articles individually.
+    """
+    results: list[str | None] = [None] * count
+    for match in _BATCH_LINE_RE.finditer(content.lower()):
+        position = int(match.group(1)) - 1
+        category = match.group(2)
+        if category not in _VALID_EVENT_TYPE_SET:
+            continue
+        if 0 <= position < count and results[position] is None:
+            results[position] = category
+    return results
+
+
 async def classify_event_type_llm(
     title: str,
     content: str,
@@ -75,12 +189,20 @@ async def classify_event_type_llm(
     Returns:
         Event type string from VALID_EVENT_TYPES (defaults to "other" on error)
     """
+    fast_path = _fast_path_event_type(title, content)
+    if fast_path is not None:
+        return fast_path
+
     # Truncate content to avoid excessive token usage
-    content_excerpt = content[:600] if content else ""
+    key = _cache_key(title, content)
+    content_excerpt = key[1]
+    cached = _cached_event_type(key)
+    if cached is not None:
+        return cached
 
     # Load prompt template from database
     prompt_template = await _get_classification_prompt()
-    prompt = prompt_template.replace("{title}", title).replace("{content}", content_excerpt)
+    prompt = _render_prompt(prompt_template, {"title": title, "content": content_excerpt})
 
     # Get temperature and max_tokens from config
     config_service = get_llm_config_service()
@@ -97,7 +219,8 @@ async def classify_event_type_llm(
         classification = response.content.strip().lower()
 
         # Validate classification is one of the allowed types
-        if classification in VALID_EVENT_TYPES:
+        if classification in _VALID_EVENT_TYPE_SET:
+            _remember_event_type(key, classification)
             return classification
 
         logger.warning(
@@ -118,4 +241,157 @@ async def classify_event_type_llm(
         return "other"
 
 
-__all__ = ["classify_event_type_llm", "VALID_EVENT_TYPES"]
+async def classify_many(
+    items: Sequence[tuple[str, str]],
+    llm_client: "MistralClient",
+    concurrency: int = MAX_CONCURRENT_CLASSIFICATIONS,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[str]:
+    """Classify articles one call each, overlapping up to ``concurrency`` LLM round-trips.
+
+    Pass ``semaphore`` to share one limit across several concurrent callers; ``concurrency``
+    is then ignored.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(title: str, content: str) -> str:
+        async with semaphore:
+            return await classify_event_type_llm(title, content, llm_client)
+
+    return list(await asyncio.gather(*(one(title, content) for title, content in items)))
+
+
+async def _classify_batch(
+    items: Sequence[tuple[str, str]],
+    llm_client: "MistralClient",
+    prompt_template: str,
+    temperature: float,
+    max_tokens: int,
+    single_semaphore: asyncio.Semaphore,
+) -> list[str]:
+    articles = "\n\n".join(
+        f"{idx}. Title: {title}\nContent: {content[:600] if content else ''}"
+        for idx, (title, content) in enumerate(items, start=1)
+    )
+    prompt = prompt_template.replace("{articles}", articles)
+
+    try:
+        response = await llm_client.generate_text(
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens * len(items),
+        )
+        parsed = _parse_batch_classification(response.content, len(items))
+        for (title, content), event_type in zip(items, parsed):
+            if event_type is not None:
+                _remember_event_type(_cache_key(title, content), event_type)
+    except Exception as e:
+        logger.warning(
+            "llm_batch_classification_failed",
+            error=str(e),
+            batch_size=len(items),
+            note="Falling back to per-article classification",
+        )
+        parsed = [None] * len(items)
+
+    missing = [idx for idx, value in enumerate(parsed) if value is None]
+    if missing:
+        if len(missing) < len(items):
+            logger.warning(
+                "llm_batch_classification_incomplete",
+                missing=len(missing),
+                batch_size=len(items),
+                note="Classifying missing articles individually",
+            )
+        retried = await classify_many(
+            [items[idx] for idx in missing], llm_client, semaphore=single_semaphore
+        )
+        for idx, event_type in zip(missing, retried):
+            parsed[idx] = event_type
+
+    return [value or "other" for value in parsed]
+
+
+async def _classify_in_batches(
+    items: Sequence[tuple[str, str]],
+    llm_client: "MistralClient",
+    prompt_template: str,
+    batch_size: int,
+    single_semaphore: asyncio.Semaphore,
+) -> list[str]:
+    config_service = get_llm_config_service()
+    temperature = await config_service.get_float("classification_temperature", default=0.1)
+    max_tokens = await config_service.get_int("classification_max_tokens", default=20)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLASSIFICATION_BATCHES)
+
+    async def run(batch: Sequence[tuple[str, str]]) -> list[str]:
+        async with semaphore:
+            return await _classify_batch(
+                batch, llm_client, prompt_template, temperature, max_tokens, single_semaphore
+            )
+
+    batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+    batch_results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [event_type for batch_result in batch_results for event_type in batch_result]
+
+
+async def classify_event_types_batch(
+    items: Sequence[tuple[str, str]],
+    llm_client: "MistralClient",
+    batch_size: int = CLASSIFICATION_BATCH_SIZE,
+) -> list[str]:
+    """
+    Classify many articles with one LLM call per batch instead of one per article.
+
+    Args:
+        items: (title, content) pairs; content is truncated to 600 chars per article
+        llm_client: Mistral LLM client instance
+        batch_size: Number of articles per prompt
+
+    Returns:
+        Event type per item, in input order. Titles matching the keyword fast path and
+        articles classified before skip the LLM, duplicates are sent once; articles the
+        batch answer does not cover are classified individually via classify_event_type_llm.
+    """
+    results: list[str | None] = []
+    # Articles still needing the LLM, one entry per distinct (title, excerpt)
+    pending: dict[tuple[str, str], list[int]] = {}
+    for idx, (title, content) in enumerate(items):
+        event_type = _fast_path_event_type(title, content)
+        if event_type is None:
+            key = _cache_key(title, content)
+            event_type = _cached_event_type(key)
+            if event_type is None:
+                pending.setdefault(key, []).append(idx)
+        results.append(event_type)
+
+    if pending:
+        pending_items = list(pending)
+        prompt_template = await _get_batch_classification_prompt()
+        # One limit for every single-article call of this run, whichever batch falls back
+        single_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLASSIFICATIONS)
+        if "{articles}" in prompt_template:
+            classified = await _classify_in_batches(
+                pending_items, llm_client, prompt_template, batch_size, single_semaphore
+            )
+        else:
+            logger.warning(
+                "batch_classification_prompt_missing", note="Classifying articles individually"
+            )
+            classified = await classify_many(pending_items, llm_client, semaphore=single_semaphore)
+        for indices, event_type in zip(pending.values(), classified):
+            for idx in indices:
+                results[idx] = event_type
+
+    return [event_type or "other" for event_type in results]
+
+
+__all__ = [
+    "classify_event_type_llm",
+    "classify_event_types_batch",
+    "classify_many",
+    "clear_classification_cache",
+    "VALID_EVENT_TYPES",
+]
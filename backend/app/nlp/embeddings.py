@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
 
 try:  # pragma: no cover - import guard for optional dependency
     from sentence_transformers import SentenceTransformer
@@ -16,6 +20,17 @@ from backend.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_COALESCE_WINDOW = 0.005  # seconds to wait for more texts before encoding a partial batch
+
+
+@dataclass(slots=True)
+class _LoopQueue:
+    """Texts awaiting encoding for one event loop, and the task flushing them."""
+
+    pending: List[Tuple[str, asyncio.Future[np.ndarray]]] = field(default_factory=list)
+    flusher: asyncio.Task[None] | None = None
+
 
 class EmbeddingService:
     """Lazily loads and serves sentence-transformer embeddings."""
@@ -25,13 +40,20 @@ class EmbeddingService:
         *,
         model_name: str | None = None,
         cache_dir: str | Path | None = None,
+        dtype: str | None = None,
     ) -> None:
         settings = get_settings()
         self.model_name = model_name or settings.embedding_model_name
+        self.dtype = dtype or settings.embedding_dtype
         default_cache = Path(settings.model_cache_dir)
         self.cache_dir = Path(cache_dir) if cache_dir else default_cache
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._model: SentenceTransformer | None = None
+        self._reduced_precision = False
+        # One long-lived worker thread owns the model; concurrent requests are queued
+        # per event loop and encoded together by that loop's flush task.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._queues: Dict[asyncio.AbstractEventLoop, _LoopQueue] = {}
 
     def _load_model(self) -> SentenceTransformer:
         if self._model is None:
@@ -40,41 +62,120 @@ class EmbeddingService:
                     "sentence-transformers is not installed. Run 'pip install sentence-transformers' first."
                 )
             logger.info("loading_embedding_model", model=self.model_name, cache=str(self.cache_dir))
-            self._model = SentenceTransformer(self.model_name, cache_folder=str(self.cache_dir))
+            model = SentenceTransformer(self.model_name, cache_folder=str(self.cache_dir))
+            self._reduced_precision = self._apply_dtype(model)
+            self._model = model
         return self._model
 
-    async def embed(self, text: str) -> List[float]:
-        """Encode a single text into a normalized embedding."""
-
-        if not text:
-            return []
-
+    def _apply_dtype(self, model: SentenceTransformer) -> bool:
+        """Cast the model to the configured precision; returns whether it was cast."""
+
+        if self.dtype == "float32":
+            return False
+        device = next(model.parameters()).device.type
+        if self.dtype == "float16" and device == "cuda":
+            model.half()
+        elif self.dtype == "bfloat16":
+            import torch
+
+            model.to(torch.bfloat16)
+        else:
+            logger.warning("embedding_dtype_unsupported", dtype=self.dtype, device=device)
+            return False
+        logger.info("embedding_dtype_applied", dtype=self.dtype, device=device)
+        return True
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
         model = self._load_model()
+        if self._reduced_precision:
+            # NumPy has no bfloat16; upcast on the tensor side before converting.
+            tensors = model.encode(
+                texts,
+                normalize_embeddings=True,
+                convert_to_tensor=True,
+                show_progress_bar=False,
+            )
+            return tensors.float().cpu().numpy()
+        vectors = model.encode(
+            texts,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _queue_for(self, loop: asyncio.AbstractEventLoop) -> _LoopQueue:
+        for closed_loop in [other for other in self._queues if other.is_closed()]:
+            stale = self._queues.pop(closed_loop)
+            abandoned = sum(1 for _, future in stale.pending if not future.done())
+            if abandoned:
+                logger.warning(
+                    "embedding_requests_abandoned",
+                    count=abandoned,
+                    note="Event loop closed before the texts were encoded",
+                )
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = _LoopQueue()
+        return queue
+
+    def _submit(self, texts: Sequence[str]) -> List[asyncio.Future[np.ndarray]]:
+        loop = asyncio.get_running_loop()
+        queue = self._queue_for(loop)
+        futures: List[asyncio.Future[np.ndarray]] = []
+        for text in texts:
+            future: asyncio.Future[np.ndarray] = loop.create_future()
+            queue.pending.append((text, future))
+            futures.append(future)
+        if queue.flusher is None or queue.flusher.done():
+            queue.flusher = loop.create_task(self._flush_pending(queue))
+        return futures
+
+    async def _flush_pending(self, queue: _LoopQueue) -> None:
+        loop = asyncio.get_running_loop()
+        while queue.pending:
+            if len(queue.pending) < EMBEDDING_BATCH_SIZE:
+                await asyncio.sleep(EMBEDDING_COALESCE_WINDOW)
+            batch = [
+                (text, future)
+                for text, future in queue.pending[:EMBEDDING_BATCH_SIZE]
+                if not future.done()
+            ]
+            del queue.pending[:EMBEDDING_BATCH_SIZE]
+            if not batch:
+                continue
+            try:
+                vectors = await loop.run_in_executor(
+                    self._executor, self._encode_batch, [text for text, _ in batch]
+                )
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Encode a single text into a normalized ``float32`` embedding."""
 
-        def _encode_single() -> List[float]:
-            vector = model.encode(text, normalize_embeddings=True)
-            return vector.tolist()
+        if not text:
+            return np.empty(0, dtype=np.float32)
 
-        return await asyncio.to_thread(_encode_single)
+        (future,) = self._submit([text])
+        return await future
 
-    async def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
-        """Encode multiple texts in one batch for efficiency."""
+    async def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode multiple texts into an ``(N, D)`` array, batching with concurrent callers."""
 
         filtered_texts = list(texts)
         if not filtered_texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
 
-        model = self._load_model()
+        return np.stack(await asyncio.gather(*self._submit(filtered_texts)))
 
-        def _encode_many() -> List[List[float]]:
-            vectors = model.encode(
-                filtered_texts,
-                normalize_embeddings=True,
-                convert_to_numpy=False,
-                show_progress_bar=False,
-            )
-            if isinstance(vectors, list):
-                return [vector.tolist() if hasattr(vector, "tolist") else list(vector) for vector in vectors]
-            return vectors.tolist()  # type: ignore[return-value]
+    async def embed_many_json(self, texts: Sequence[str]) -> List[List[float]]:
+        """Encode multiple texts as plain lists for JSON responses."""
 
-        return await asyncio.to_thread(_encode_many)
+        return (await self.embed_many(texts)).tolist()
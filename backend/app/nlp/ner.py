@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -13,13 +14,13 @@ else:  # pragma: no cover
 from backend.app.nlp import get_spacy_model
 
 # Blacklist: Common Dutch news sites/platforms mislabeled as locations by NER
-LOCATION_BLACKLIST = {
+LOCATION_BLACKLIST = frozenset({
     "nu.nl", "nujij", "nos", "rtl nieuws", "ad", "telegraaf", "volkskrant",
     "trouw", "nrc", "nh nieuws", "omroep", "bnr", "rtv", "rijnmond",
-}
+})
 
 # Known Dutch cities/provinces for location validation
-KNOWN_DUTCH_LOCATIONS = {
+KNOWN_DUTCH_LOCATIONS = frozenset({
     # Major cities
     "amsterdam", "rotterdam", "den haag", "'s-gravenhage", "utrecht", "eindhoven",
     "groningen", "tilburg", "almere", "breda", "nijmegen", "arnhem", "haarlem",
@@ -46,7 +47,19 @@ KNOWN_DUTCH_LOCATIONS = {
     "bonaire", "saba", "sint eustatius", "curaçao", "aruba", "sint maarten",
     # Cities from visible articles
     "singapore", "bakoe", "monza", "zandvoort", "las vegas", "abu dhabi",
-}
+})
+
+# GPE = countries/cities, LOC = non-GPE locations
+_LOCATION_LABELS = frozenset({"GPE", "LOC"})
+
+
+# One alternation over all known locations, longest names first, matched as whole words
+# (so "dam" never matches inside "Amsterdam").
+_KNOWN_LOCATION_RE = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(KNOWN_DUTCH_LOCATIONS, key=len, reverse=True)))
+    + r")\b"
+)
 
 
 def _extract_locations_from_title(title: str) -> List[str]:
@@ -59,18 +72,21 @@ def _extract_locations_from_title(title: str) -> List[str]:
     if not title:
         return []
 
-    title_lower = title.lower()
-    found = []
+    # Capitalize first letter for consistency; in title order, each location once
+    return [city.capitalize() for city in dict.fromkeys(_KNOWN_LOCATION_RE.findall(title.lower()))]
+
+
+# Pipes entity recognition depends on; the rest of the pipeline is skipped when extracting
+_NER_PIPES = frozenset({"tok2vec", "transformer", "ner"})
 
-    for city in KNOWN_DUTCH_LOCATIONS:
-        # Match city name as whole word (with word boundaries)
-        # This prevents partial matches like "dam" in "Amsterdam"
-        pattern = rf'\b{re.escape(city)}\b'
-        if re.search(pattern, title_lower):
-            # Capitalize first letter for consistency
-            found.append(city.capitalize())
 
-    return found
+@dataclass(slots=True)
+class EntityAnalysis:
+    """Entities, dates and locations extracted from one parsed text."""
+
+    entities: List[Dict[str, object]]
+    dates: List[str]
+    locations: List[str]
 
 
 class NamedEntityExtractor:
@@ -83,6 +99,7 @@ class NamedEntityExtractor:
         include_labels: Optional[Sequence[str]] = None,
     ) -> None:
         self._model = model
+        self._disabled_pipes: List[str] | None = None
         self.include_labels = set(include_labels) if include_labels else None
 
     @property
@@ -91,11 +108,53 @@ class NamedEntityExtractor:
             self._model = get_spacy_model()
         return self._model
 
+    def _parse_kwargs(self) -> Dict[str, object]:
+        """Skip every pipe entity recognition doesn't need (parser, lemmatizer, ...)."""
+        if self._disabled_pipes is None:
+            pipe_names = getattr(self.nlp, "pipe_names", ())
+            self._disabled_pipes = [name for name in pipe_names if name not in _NER_PIPES]
+        return {"disable": self._disabled_pipes} if self._disabled_pipes else {}
+
     def extract(self, text: str) -> List[Dict[str, object]]:
         if not text:
             return []
+        return self._entities_from_doc(self.nlp(text, **self._parse_kwargs()))
+
+    def extract_dates(self, text: str) -> List[str]:
+        """Extract explicit date entities (DATE labels) from text."""
+        if not text:
+            return []
+        return self._dates_from_doc(self.nlp(text, **self._parse_kwargs()))
 
-        doc = self.nlp(text)
+    def extract_locations(self, text: str, title: str = "") -> List[str]:
+        """Extract location entities (GPE, LOC labels) from text, filtered for quality."""
+        if not text:
+            return []
+        return self._locations_from_doc(self.nlp(text, **self._parse_kwargs()), title)
+
+    def analyze_many(
+        self,
+        texts: Sequence[str],
+        titles: Sequence[str] | None = None,
+        *,
+        batch_size: int = 64,
+    ) -> List[EntityAnalysis]:
+        """Entities, dates and locations per text, parsing each text once via ``nlp.pipe``."""
+        results = [EntityAnalysis(entities=[], dates=[], locations=[]) for _ in texts]
+        indices = [idx for idx, text in enumerate(texts) if text]
+        docs = self.nlp.pipe(
+            (texts[idx] for idx in indices), batch_size=batch_size, **self._parse_kwargs()
+        )
+        for idx, doc in zip(indices, docs):
+            title = titles[idx] if titles else ""
+            results[idx] = EntityAnalysis(
+                entities=self._entities_from_doc(doc),
+                dates=self._dates_from_doc(doc),
+                locations=self._locations_from_doc(doc, title),
+            )
+        return results
+
+    def _entities_from_doc(self, doc) -> List[Dict[str, object]]:
         entities: List[Dict[str, object]] = []
         for ent in doc.ents:
             if self.include_labels and ent.label_ not in self.include_labels:
@@ -110,53 +169,44 @@ class NamedEntityExtractor:
             )
         return entities
 
-    def extract_dates(self, text: str) -> List[str]:
-        """Extract explicit date entities (DATE labels) from text."""
-        if not text:
-            return []
-
-        doc = self.nlp(text)
-        dates = []
+    @staticmethod
+    def _dates_from_doc(doc) -> List[str]:
+        # Deduplicate case-insensitively while preserving order
+        dates: Dict[str, str] = {}
         for ent in doc.ents:
             if ent.label_ == "DATE":
-                dates.append(ent.text.strip())
-
-        # Deduplicate while preserving order
-        seen = set()
-        return [d for d in dates if not (d.lower() in seen or seen.add(d.lower()))]
-
-    def extract_locations(self, text: str, title: str = "") -> List[str]:
-        """Extract location entities (GPE, LOC labels) from text, filtered for quality."""
-        if not text:
-            return []
-
-        doc = self.nlp(text)
-        locations = []
+                date_text = ent.text.strip()
+                dates.setdefault(date_text.lower(), date_text)
+        return list(dates.values())
+
+    @staticmethod
+    def _locations_from_doc(doc, title: str = "") -> List[str]:
+        # Deduplicate case-insensitively while preserving order
+        locations: Dict[str, str] = {}
         for ent in doc.ents:
-            if ent.label_ in ("GPE", "LOC"):  # GPE = countries/cities, LOC = non-GPE locations
-                location_text = ent.text.strip()
-                location_lower = location_text.lower()
+            if ent.label_ not in _LOCATION_LABELS:
+                continue
+            location_text = ent.text.strip()
+            location_lower = location_text.lower()
 
-                # Filter out blacklisted website names
-                if location_lower in LOCATION_BLACKLIST:
-                    continue
+            # Filter out blacklisted website names
+            if location_lower in LOCATION_BLACKLIST:
+                continue
 
-                # Only include if it's in known locations OR has multiple words (likely real location)
-                # Single-word unknown locations are often NER errors
-                is_known = location_lower in KNOWN_DUTCH_LOCATIONS
-                is_multi_word = " " in location_text or "-" in location_text or "'" in location_text
+            # Only include if it's in known locations OR has multiple words (likely real location)
+            # Single-word unknown locations are often NER errors
+            is_known = location_lower in KNOWN_DUTCH_LOCATIONS
+            is_multi_word = " " in location_text or "-" in location_text or "'" in location_text
 
-                if is_known or is_multi_word:
-                    locations.append(location_text)
+            if is_known or is_multi_word:
+                locations.setdefault(location_lower, location_text)
 
         # Fallback: extract known cities from title (catches cases NER misses)
         if title:
-            title_locations = _extract_locations_from_title(title)
-            locations.extend(title_locations)
+            for city in _extract_locations_from_title(title):
+                locations.setdefault(city.lower(), city)
 
-        # Deduplicate while preserving order
-        seen = set()
-        return [loc for loc in locations if not (loc.lower() in seen or seen.add(loc.lower()))]
+        return list(locations.values())
 
 
 def extract_entities(text: str) -> List[Dict[str, object]]:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+import string
 import unicodedata
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from spacy.language import Language
@@ -15,6 +18,12 @@ else:  # pragma: no cover - runtime fallback
 from backend.app.nlp import get_spacy_model
 
 TOKEN_RE = re.compile(r"[\w'-]+", flags=re.UNICODE)
+# Lowercased characters TOKEN_RE always accepts; tokens made only of these skip the regex
+_TOKEN_CHARS = frozenset(string.ascii_lowercase + string.digits + "_'-àáâäçèéêëíïñóôöúü")
+# Pipes normalization never reads: lemmas come from the tagger/morphologizer/lemmatizer
+_UNUSED_PIPES = ("parser", "senter", "ner")
+# Token flags that drop a token, read for the whole doc with one ``Doc.to_array`` call
+_DROP_FLAGS = ("IS_SPACE", "IS_PUNCT", "IS_DIGIT", "LIKE_NUM")
 
 
 @dataclass(slots=True)
@@ -36,6 +45,7 @@ class TextPreprocessor:
         lemmatize: bool = True,
     ) -> None:
         self._model = model
+        self._disabled_pipes: List[str] | None = None
         self.remove_stopwords = remove_stopwords
         self.lemmatize = lemmatize
 
@@ -45,6 +55,12 @@ class TextPreprocessor:
             self._model = get_spacy_model()
         return self._model
 
+    def _parse_kwargs(self) -> Dict[str, object]:
+        if self._disabled_pipes is None:
+            pipe_names = getattr(self.nlp, "pipe_names", ())
+            self._disabled_pipes = [name for name in _UNUSED_PIPES if name in pipe_names]
+        return {"disable": self._disabled_pipes} if self._disabled_pipes else {}
+
     def normalize(self, text: str) -> NormalizationResult:
         """Normalize text returning processed string and token list."""
 
@@ -52,22 +68,49 @@ class TextPreprocessor:
             return NormalizationResult(normalized_text="", tokens=[])
 
         cleaned = self._basic_clean(text)
-        doc = self.nlp(cleaned)
-
+        return self._result_from_doc(self.nlp(cleaned, **self._parse_kwargs()))
+
+    def normalize_many(
+        self, texts: Sequence[str], *, batch_size: int = 64
+    ) -> List[NormalizationResult]:
+        """Normalize several texts, streaming them through ``nlp.pipe`` in batches."""
+
+        results = [NormalizationResult(normalized_text="", tokens=[]) for _ in texts]
+        indices = [idx for idx, text in enumerate(texts) if text]
+        docs = self.nlp.pipe(
+            (self._basic_clean(texts[idx]) for idx in indices),
+            batch_size=batch_size,
+            **self._parse_kwargs(),
+        )
+        for idx, doc in zip(indices, docs):
+            results[idx] = self._result_from_doc(doc)
+        return results
+
+    def _kept_tokens(self, doc) -> List:
+        to_array = getattr(doc, "to_array", None)
+        if to_array is None or not len(doc):
+            return [
+                token
+                for token in doc
+                if not (
+                    token.is_space
+                    or token.is_punct
+                    or token.is_digit
+                    or token.like_num
+                    or (self.remove_stopwords and token.is_stop)
+                )
+            ]
+        flags = to_array([*_DROP_FLAGS, "IS_STOP"] if self.remove_stopwords else list(_DROP_FLAGS))
+        return [doc[int(index)] for index in np.flatnonzero(~flags.any(axis=1))]
+
+    def _result_from_doc(self, doc) -> NormalizationResult:
         tokens: List[str] = []
-        for token in doc:
-            if token.is_space or token.is_punct or token.is_digit:
-                continue
-            if self.remove_stopwords and token.is_stop:
-                continue
-            if token.like_num:
-                continue
-
+        for token in self._kept_tokens(doc):
             value = token.lemma_ if self.lemmatize else token.text
             value = value.strip().lower()
             if not value:
                 continue
-            if not TOKEN_RE.fullmatch(value):
+            if not (_TOKEN_CHARS.issuperset(value) or TOKEN_RE.fullmatch(value)):
                 continue
             tokens.append(value)
 
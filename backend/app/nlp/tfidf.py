@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
 import joblib
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from backend.app.core.config import get_settings
@@ -28,16 +29,19 @@ class TfidfVectorizerManager:
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         self.max_features = max_features or settings.tfidf_max_features
         self.vectorizer: TfidfVectorizer | None = None
+        self._feature_names: np.ndarray | None = None
         self._load()
 
     def _load(self) -> None:
         if self.cache_path.exists():
             try:
                 self.vectorizer = joblib.load(self.cache_path)
+                self._feature_names = self.vectorizer.get_feature_names_out()
                 logger.info("loaded_tfidf_vectorizer", path=str(self.cache_path))
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("failed_to_load_tfidf", error=str(exc), path=str(self.cache_path))
                 self.vectorizer = None
+                self._feature_names = None
 
     def _persist(self) -> None:
         if self.vectorizer is None:
@@ -58,6 +62,7 @@ class TfidfVectorizerManager:
         )
         vectorizer.fit(documents)
         self.vectorizer = vectorizer
+        self._feature_names = vectorizer.get_feature_names_out()
         self._persist()
 
     def transform(self, text: str) -> Dict[str, float]:
@@ -73,13 +78,38 @@ class TfidfVectorizerManager:
             return {}
 
         matrix = self.vectorizer.transform([text])
-        feature_names = self.vectorizer.get_feature_names_out()
+        feature_names = self._feature_names
         indices = matrix.indices
         data = matrix.data
         return {feature_names[idx]: float(weight) for idx, weight in zip(indices, data)}
 
+    def transform_many(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """Convert texts to feature dicts with a single vectorizer call."""
+
+        vectors: List[Dict[str, float]] = [{} for _ in texts]
+        positions = [index for index, text in enumerate(texts) if text]
+        if not positions:
+            return vectors
+
+        if self.vectorizer is None:
+            self.fit([texts[index] for index in positions])
+
+        if self.vectorizer is None:
+            return vectors
+
+        matrix = self.vectorizer.transform([texts[index] for index in positions])
+        feature_names = self._feature_names
+        indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+        for row, index in enumerate(positions):
+            start, end = indptr[row], indptr[row + 1]
+            vectors[index] = {
+                feature_names[idx]: float(weight)
+                for idx, weight in zip(indices[start:end], data[start:end])
+            }
+        return vectors
+
     def fit_and_transform(self, corpus: Sequence[str]) -> List[Dict[str, float]]:
         """Convenience helper that re-fits on corpus and returns vectors."""
 
         self.fit(corpus)
-        return [self.transform(doc) for doc in corpus]
+        return self.transform_many(corpus)
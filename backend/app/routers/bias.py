@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
@@ -32,10 +32,10 @@ router = APIRouter(prefix="/api/v1", tags=["bias"])
 
 def _build_sentence_bias_responses(
     biases: List[Dict],
-) -> List[SentenceBiasResponse]:
+) -> Tuple[SentenceBiasResponse, ...]:
     """Convert raw bias dictionaries to response models."""
-    return [
-        SentenceBiasResponse(
+    return tuple(
+        SentenceBiasResponse.from_trusted(
             sentence_index=b.get("sentence_index", 0),
             sentence_text=b.get("sentence_text", ""),
             bias_type=b.get("bias_type", "Unknown"),
@@ -45,7 +45,7 @@ def _build_sentence_bias_responses(
             explanation=b.get("explanation", ""),
         )
         for b in biases
-    ]
+    )
 
 
 @router.get("/articles/{article_id}/bias")
@@ -95,7 +95,7 @@ async def get_article_bias(
         overall_journalist_rating=analysis.overall_rating,
     )
 
-    response = ArticleBiasResponse(
+    response = ArticleBiasResponse.from_trusted(
         article_id=article_id,
         analyzed_at=analysis.analyzed_at,
         provider=analysis.provider,
@@ -113,8 +113,8 @@ async def get_article_bias(
     )
 
     return {
-        "data": response.model_dump(),
-        "meta": meta.model_dump(),
+        "data": response.model_dump(mode="json"),
+        "meta": meta.model_dump(mode="json"),
     }
 
 
@@ -232,7 +232,7 @@ async def get_event_bias_summary(
         total_rating = sum(a.overall_rating for a in analyses)
         average_bias_rating = round(total_rating / articles_analyzed, 3)
 
-    summary = EventBiasSummary(
+    summary = EventBiasSummary.from_trusted(
         event_id=event_id,
         total_articles=total_articles,
         articles_analyzed=articles_analyzed,
@@ -249,6 +249,6 @@ async def get_event_bias_summary(
     )
 
     return {
-        "data": summary.model_dump(),
-        "meta": meta.model_dump(),
+        "data": summary.model_dump(mode="json"),
+        "meta": meta.model_dump(mode="json"),
     }
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from typing import List, Optional, Set
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,6 +27,9 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["events"])
 
+# Dumps the whole feed in one pydantic-core call; FastAPI then only walks plain JSON values
+_EVENT_ITEMS_ADAPTER: TypeAdapter[List[EventListItem]] = TypeAdapter(List[EventListItem])
+
 
 async def _get_main_source_info(session: AsyncSession) -> tuple[bool, Set[str]]:
     """Get main source configuration for filtering events.
@@ -150,7 +154,7 @@ async def list_events(
                 break
 
         event_items.append(
-            EventListItem(
+            EventListItem.from_trusted(
                 id=event.id,
                 slug=event.slug,
                 title=event.title or f"Event {event.id}",
@@ -182,8 +186,8 @@ async def list_events(
     )
 
     return {
-        "data": event_items,
-        "meta": meta.model_dump(),
+        "data": _EVENT_ITEMS_ADAPTER.dump_python(event_items, mode="json"),
+        "meta": meta.model_dump(mode="json"),
     }
 
 
@@ -234,7 +238,7 @@ async def get_event_detail(
                 spectrum_value = str(raw_spectrum)
 
         article_responses.append(
-            EventArticleResponse(
+            EventArticleResponse.from_trusted(
                 id=article.id,
                 title=article.title,
                 url=article.url,
@@ -259,7 +263,7 @@ async def get_event_detail(
         ][:10]  # Limit to top 10
 
     # Build response
-    event_detail = EventDetail(
+    event_detail = EventDetail.from_trusted(
         id=event.id,
         slug=event.slug,
         title=event.title or f"Event {event.id}",
@@ -289,6 +293,6 @@ async def get_event_detail(
     )
 
     return {
-        "data": event_detail.model_dump(),
-        "meta": meta.model_dump(),
+        "data": event_detail.model_dump(mode="json"),
+        "meta": meta.model_dump(mode="json"),
     }
@@ -79,7 +79,7 @@ async def get_event_insights(
     )
 
     return {
-        "data": aggregation.model_dump(),
+        "data": aggregation.model_dump(mode="json"),
         "meta": {
             "event_id": event_id,
             "provider": insight.provider,
@@ -6,6 +6,7 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import Any
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.app.core.config import Settings, get_settings
@@ -22,12 +23,15 @@ from backend.app.llm.client import (
     LLMTimeoutError,
     MistralClient,
 )
-from backend.app.llm.schemas import BiasAnalysisPayload
+from backend.app.llm.schemas import BiasAnalysisPayload, SentenceBias
 from backend.app.repositories.bias_repo import BiasRepository
 from backend.app.services.llm_config_service import get_llm_config_service
 
 logger = get_logger(__name__).bind(component="BiasDetectionService")
 
+# Built once at import: serializes a whole bias list in one call instead of one model per item
+_SENTENCE_BIASES_ADAPTER: TypeAdapter[list[SentenceBias]] = TypeAdapter(list[SentenceBias])
+
 
 @dataclass(slots=True)
 class BiasAnalysisOutcome:
@@ -124,20 +128,23 @@ class BiasDetectionService:
         # Percentage of sentences with journalist bias
         journalist_percentage = (journalist_count / total * 100) if total > 0 else 0.0
 
+        # Tally bias types and strengths in one pass over the journalist biases
+        type_counts: Counter[str] = Counter()
+        total_strength = 0.0
+        for bias in journalist_biases:
+            type_counts[bias.bias_type] += 1
+            total_strength += bias.score
+
         # Most frequent journalist bias type
         most_frequent_bias: str | None = None
         most_frequent_count: int | None = None
-        if journalist_biases:
-            bias_types = [b.bias_type for b in journalist_biases]
-            counter = Counter(bias_types)
-            most_common = counter.most_common(1)
-            if most_common:
-                most_frequent_bias, most_frequent_count = most_common[0]
+        if type_counts:
+            most_frequent_bias, most_frequent_count = type_counts.most_common(1)[0]
 
         # Average journalist bias strength
         avg_strength: float | None = None
         if journalist_biases:
-            avg_strength = sum(b.score for b in journalist_biases) / journalist_count
+            avg_strength = total_strength / journalist_count
 
         # Overall rating: combines percentage and average strength
         # Lower score = more objective (0 = perfectly objective, 1 = heavily biased)
@@ -236,8 +243,12 @@ class BiasDetectionService:
                 most_frequent_count=stats["most_frequent_count"],
                 average_bias_strength=stats["average_bias_strength"],
                 overall_rating=stats["overall_rating"],
-                journalist_biases=[b.model_dump(mode="json") for b in payload.journalist_biases],
-                quote_biases=[b.model_dump(mode="json") for b in payload.quote_biases],
+                journalist_biases=_SENTENCE_BIASES_ADAPTER.dump_python(
+                    payload.journalist_biases, mode="json"
+                ),
+                quote_biases=_SENTENCE_BIASES_ADAPTER.dump_python(
+                    payload.quote_biases, mode="json"
+                ),
                 raw_response=result.raw_content,
             )
             await session.commit()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from array import array
+import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Iterable, List, Sequence
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -22,10 +23,10 @@ from backend.app.repositories import ArticleEnrichmentPayload, ArticleRepository
 logger = get_logger(__name__)
 
 
-def _serialize_embedding(vector: Sequence[float]) -> bytes:
-    if not vector:
+def _serialize_embedding(vector: Sequence[float] | np.ndarray) -> bytes:
+    data = np.asarray(vector, dtype=np.float32)
+    if not data.size:
         return b""
-    data = array("f", vector)
     return data.tobytes()
 
 
@@ -89,29 +90,29 @@ class ArticleEnrichmentService:
 
         prepared: List[Dict[str, object]] = []
         skipped = 0
-        for article in articles:
-            normalization = self.preprocessor.normalize(article.content)
+        # spaCy runs over the whole batch via nlp.pipe: once to normalize, once for entities
+        normalizations = self.preprocessor.normalize_many([article.content for article in articles])
+        kept: List[tuple[Article, NormalizationResult]] = []
+        for article, normalization in zip(articles, normalizations):
             if not normalization.normalized_text:
                 self.log.warning("article_normalization_empty", article_id=article.id, url=article.url)
                 skipped += 1
                 continue
-            # Extract entities and enhanced features
-            entities = self.entity_extractor.extract(article.content)
-            extracted_dates = self.entity_extractor.extract_dates(article.content)
-            extracted_locations = self.entity_extractor.extract_locations(article.content, article.title)
-
-            # Classify event type using LLM
-            from backend.app.nlp.classify import classify_event_type_llm
-            event_type = await classify_event_type_llm(article.title, article.content, self.llm_client)
+            kept.append((article, normalization))
 
+        # Extract entities and enhanced features
+        analyses = self.entity_extractor.analyze_many(
+            [article.content for article, _ in kept],
+            [article.title for article, _ in kept],
+        )
+        for (article, normalization), analysis in zip(kept, analyses):
             prepared.append(
                 {
                     "article": article,
                     "normalization": normalization,
-                    "entities": entities,
-                    "extracted_dates": extracted_dates,
-                    "extracted_locations": extracted_locations,
-                    "event_type": event_type,
+                    "entities": analysis.entities,
+                    "extracted_dates": analysis.dates,
+                    "extracted_locations": analysis.locations,
                 }
             )
 
@@ -119,20 +120,33 @@ class ArticleEnrichmentService:
             await session.rollback()
             return {"processed": 0, "skipped": skipped or len(articles)}
 
-        corpus = existing_corpus + [item["normalization"].normalized_text for item in prepared]
+        # Classify event types using LLM (network-bound) while the embedding model
+        # encodes in its worker thread; neither depends on the other.
+        from backend.app.nlp.classify import classify_event_types_batch
+        normalized_texts = [item["normalization"].normalized_text for item in prepared]
+        event_types, embeddings = await asyncio.gather(
+            classify_event_types_batch(
+                [(item["article"].title, item["article"].content) for item in prepared],
+                self.llm_client,
+            ),
+            self.embedder.embed_many(normalized_texts),
+        )
+        for item, event_type in zip(prepared, event_types):
+            item["event_type"] = event_type
+
+        corpus = existing_corpus + normalized_texts
         if corpus:
             self.tfidf_manager.fit(corpus)
 
-        normalized_texts = [item["normalization"].normalized_text for item in prepared]
-        embeddings = await self.embedder.embed_many(normalized_texts)
         if len(embeddings) != len(prepared):  # pragma: no cover - defensive
             raise RuntimeError("Embedding batch size mismatch")
         timestamp = datetime.now(timezone.utc)
 
+        tfidf_vectors = self.tfidf_manager.transform_many(normalized_texts)
+
         enriched_articles: List[Article] = []  # Collect for SQLite cache sync
-        for item, embedding in zip(prepared, embeddings):
+        for item, embedding, tfidf_vector in zip(prepared, embeddings, tfidf_vectors):
             normalization: NormalizationResult = item["normalization"]  # type: ignore[assignment]
-            tfidf_vector = self.tfidf_manager.transform(normalization.normalized_text)
             payload = ArticleEnrichmentPayload(
                 normalized_text=normalization.normalized_text,
                 normalized_tokens=normalization.tokens,
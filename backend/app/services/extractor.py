@@ -11,7 +11,7 @@ _executor = ThreadPoolExecutor(max_workers=4)
 
 
 def _extract_single(result: TavilyArticle) -> Article | None:
-    downloaded = trafilatura.fetch_url(str(result.url))
+    downloaded = trafilatura.fetch_url(result.url)
     if not downloaded:
         return None
     text = trafilatura.extract(downloaded, favor_recall=True, include_images=False, include_tables=False)
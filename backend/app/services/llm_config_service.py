@@ -35,7 +35,7 @@ _config_cache: Optional[CachedConfig] = None
 _cache_lock = asyncio.Lock()
 
 
-def _load_default_template(filename: str) -> str:
+def load_default_template(filename: str) -> str:
     """Load a default prompt template from package resources."""
     try:
         template_path = resources.files("backend.app.llm.templates").joinpath(filename)
@@ -83,6 +83,15 @@ Respond with ONLY the category name in lowercase, nothing else.""",
         "config_type": "prompt",
         "description": "Prompt voor artikel classificatie naar event type",
     },
+    {
+        "key": "prompt_classification_batch",
+        "value": "",  # Will be loaded from file
+        "config_type": "prompt",
+        "description": (
+            "Prompt voor classificatie van meerdere artikelen tegelijk "
+            "({articles} = genummerde lijst)"
+        ),
+    },
     # LLM Parameters
     {
         "key": "llm_temperature",
@@ -197,9 +206,11 @@ def _get_defaults_with_templates() -> List[Dict[str, str]]:
     for cfg in DEFAULT_CONFIGS:
         cfg_copy = cfg.copy()
         if cfg["key"] == "prompt_factual":
-            cfg_copy["value"] = _load_default_template("factual_prompt.txt")
+            cfg_copy["value"] = load_default_template("factual_prompt.txt")
         elif cfg["key"] == "prompt_critical":
-            cfg_copy["value"] = _load_default_template("critical_prompt.txt")
+            cfg_copy["value"] = load_default_template("critical_prompt.txt")
+        elif cfg["key"] == "prompt_classification_batch":
+            cfg_copy["value"] = load_default_template("classification_batch_prompt.txt")
         configs.append(cfg_copy)
     return configs
 
@@ -416,4 +427,4 @@ def get_llm_config_service() -> LlmConfigService:
     return _service_instance
 
 
-__all__ = ["LlmConfigService", "get_llm_config_service", "DEFAULT_CONFIGS"]
+__all__ = ["LlmConfigService", "get_llm_config_service", "load_default_template", "DEFAULT_CONFIGS"]
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Iterable, Sequence
 
 import requests
+from pydantic import TypeAdapter
 
 from backend.app.config import get_settings
 from backend.app.models import (
@@ -17,6 +18,10 @@ from backend.app.models import (
     TimelineEvent,
 )
 
+# Built once: validates a whole LLM list in one call instead of one model per item
+_TIMELINE_ADAPTER = TypeAdapter(list[TimelineEvent])
+_CONTRADICTIONS_ADAPTER = TypeAdapter(list[Contradiction])
+
 _SYSTEM_PROMPT = (
     "Je bent een onderzoeksjournalist die pluriforme nieuwsduiding levert. "
     "Je krijgt artikelen over één gebeurtenis in Nederland. Analyseer ze en presenteer een neutrale tijdlijn, "
@@ -138,7 +143,7 @@ def _parse_json_response(raw_content: str, provider: str) -> dict:
 
 
 def _build_response(query: str, data: dict) -> AggregationResponse:
-    timeline = [TimelineEvent(**event) for event in data.get("timeline", [])]
+    timeline = _TIMELINE_ADAPTER.validate_python(data.get("timeline", []))
     clusters = [
         Cluster(
             angle=cluster.get("angle", "Onbekend"),
@@ -156,10 +161,7 @@ def _build_response(query: str, data: dict) -> AggregationResponse:
         )
         for item in data.get("fallacies", [])
     ]
-    contradictions = [
-        Contradiction.model_validate(ct)
-        for ct in data.get("contradictions", [])
-    ]
+    contradictions = _CONTRADICTIONS_ADAPTER.validate_python(data.get("contradictions", []))
 
     return AggregationResponse(
         query=query,
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from backend.app.db.models import Article, Base
 from backend.app.services.enrich_service import ArticleEnrichmentService
+from backend.app.nlp.ner import EntityAnalysis
 from backend.app.nlp.preprocess import TextPreprocessor
 from backend.app.nlp.tfidf import TfidfVectorizerManager
 
@@ -36,6 +37,9 @@ class DummyModel:
         tokens = [DummyToken(chunk, self.stopwords) for chunk in text.split()]
         return DummyDoc(tokens)
 
+    def pipe(self, texts, batch_size: int = 64):
+        return (self(text) for text in texts)
+
 
 @pytest.fixture
 def session_factory(tmp_path) -> async_sessionmaker[AsyncSession]:
@@ -72,6 +76,16 @@ class StubEntityExtractor:
     def extract_locations(self, text: str, title: str = ""):
         return ["Den Haag"]
 
+    def analyze_many(self, texts, titles=None, *, batch_size: int = 64):
+        return [
+            EntityAnalysis(
+                entities=self.extract(text),
+                dates=self.extract_dates(text),
+                locations=self.extract_locations(text),
+            )
+            for text in texts
+        ]
+
 
 @pytest.mark.asyncio
 async def test_enrichment_updates_article_fields(session_factory, tmp_path):
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.nlp import classify
+
+
+class _StubConfigService:
+    async def get_value(self, key: str) -> str | None:
+        return None
+
+    async def get_float(self, key: str, default: float = 0.0) -> float:
+        return default
+
+    async def get_int(self, key: str, default: int = 0) -> int:
+        return default
+
+
+class _StubClient:
+    def __init__(self, answers: list[str]) -> None:
+        self.answers = list(answers)
+        self.prompts: list[str] = []
+
+    async def generate_text(self, prompt: str, **kwargs) -> SimpleNamespace:
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=self.answers.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def _stub_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(classify, "get_llm_config_service", lambda: _StubConfigService())
+    classify.clear_classification_cache()
+
+
+@pytest.mark.asyncio
+async def test_batch_classification_uses_one_call_per_batch() -> None:
+    client = _StubClient(["1. politics\n2. Sports\n3. other"])
+    items = [("Kabinet valt", "..."), ("Ajax wint", "..."), ("Iets", "...")]
+
+    result = await classify.classify_event_types_batch(items, client)
+
+    assert result == ["politics", "sports", "other"]
+    assert len(client.prompts) == 1
+    assert "2. Title: Ajax wint" in client.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_batch_classification_falls_back_for_unanswered_articles() -> None:
+    client = _StubClient(["1. crime", "weather"])
+    items = [("Overval", "..."), ("Storm", "...")]
+
+    result = await classify.classify_event_types_batch(items, client)
+
+    assert result == ["crime", "weather"]
+    assert len(client.prompts) == 2
+    assert "Title: Storm" in client.prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_off_list_batch_categories_are_classified_individually() -> None:
+    client = _StubClient(["1. politiek\n2. crime\n3. Title: Storm", "politics", "weather"])
+    items = [("Kabinet valt", "..."), ("Overval", "..."), ("Storm", "...")]
+
+    result = await classify.classify_event_types_batch(items, client)
+
+    assert result == ["politics", "crime", "weather"]
+    assert len(client.prompts) == 3
+    assert "Title: Kabinet valt" in client.prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_single_classification_does_not_expand_placeholders_in_titles() -> None:
+    client = _StubClient(["politics"])
+
+    result = await classify.classify_event_type_llm("Debat over {content}", "Inhoud", client)
+
+    assert result == "politics"
+    assert "Title: Debat over {content}" in client.prompts[0]
+    assert "Content: Inhoud" in client.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_fast_path_titles_skip_the_llm() -> None:
+    client = _StubClient(["1. politics"])
+    items = [
+        ("KNMI geeft code oranje af", "..."),
+        ("Kabinet valt", "..."),
+        ("Ajax wint in de Eredivisie", "..."),
+    ]
+
+    result = await classify.classify_event_types_batch(items, client)
+
+    assert result == ["weather", "politics", "sports"]
+    assert len(client.prompts) == 1
+    assert "KNMI" not in client.prompts[0]
+    assert await classify.classify_event_type_llm("Eredivisie: PSV wint", "", client) == "sports"
+
+
+@pytest.mark.asyncio
+async def test_blank_articles_are_other_without_llm_call() -> None:
+    client = _StubClient([])
+
+    assert await classify.classify_event_type_llm(" ", "", client) == "other"
+    assert await classify.classify_event_types_batch([("", "  ")], client) == ["other"]
+    assert client.prompts == []
+
+
+@pytest.mark.asyncio
+async def test_duplicate_articles_are_classified_once() -> None:
+    client = _StubClient(["1. crime", "crime"])
+    wire_copy = ("Overval op juwelier", "Zelfde ANP-tekst")
+
+    result = await classify.classify_event_types_batch([wire_copy, wire_copy], client)
+
+    assert result == ["crime", "crime"]
+    assert await classify.classify_event_type_llm(*wire_copy, client) == "crime"
+    assert len(client.prompts) == 1
+    assert "2. Title" not in client.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_fallback_calls_share_one_limit_across_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(classify, "MAX_CONCURRENT_CLASSIFICATIONS", 2)
+
+    class _CountingClient:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.peak = 0
+
+        async def generate_text(self, prompt: str, **kwargs) -> SimpleNamespace:
+            if prompt.startswith("Classify each"):
+                return SimpleNamespace(content="")
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return SimpleNamespace(content="crime")
+
+    client = _CountingClient()
+    items = [(f"Overval {idx}", "...") for idx in range(6)]
+
+    result = await classify.classify_event_types_batch(items, client, batch_size=2)
+
+    assert result == ["crime"] * 6
+    assert client.peak == 2
+
+
+def test_batch_prompt_default_matches_seeded_config() -> None:
+    from backend.app.services.llm_config_service import _get_defaults_with_templates
+
+    seeded = {cfg["key"]: cfg["value"] for cfg in _get_defaults_with_templates()}
+
+    assert "{articles}" in classify.DEFAULT_BATCH_CLASSIFICATION_PROMPT
+    assert seeded["prompt_classification_batch"] == classify.DEFAULT_BATCH_CLASSIFICATION_PROMPT
+
+
+@pytest.mark.asyncio
+async def test_off_list_answers_are_not_cached() -> None:
+    client = _StubClient(["1. politiek", "politiek", "politics"])
+
+    assert await classify.classify_event_types_batch([("Kabinet valt", "x")], client) == ["other"]
+    assert await classify.classify_event_type_llm("Kabinet valt", "x", client) == "politics"
+    assert len(client.prompts) == 3
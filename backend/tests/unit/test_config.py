@@ -102,6 +102,16 @@ class TestSettings:
             Settings()
         assert "less than or equal to 1440" in str(exc_info.value)
 
+    def test_embedding_dtype_rejects_unknown_precision(self, monkeypatch):
+        """Test that EMBEDDING_DTYPE only accepts the supported precisions."""
+        monkeypatch.setenv("EMBEDDING_DTYPE", "bfloat16")
+        assert Settings().embedding_dtype == "bfloat16"
+
+        monkeypatch.setenv("EMBEDDING_DTYPE", "bf16")
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
+        assert "embedding_dtype" in str(exc_info.value)
+
     def test_settings_case_insensitive_env_vars(self, monkeypatch):
         """Test that environment variables are case-insensitive."""
         # Arrange
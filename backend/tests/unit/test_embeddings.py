@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from typing import List
 
+import numpy as np
 import pytest
 
 from backend.app.nlp.embeddings import EmbeddingService
 
 
-import numpy as np
-
-
 class DummySentenceTransformer:
     def __init__(self, *args, **kwargs):
         self.calls: List[List[str]] = []
@@ -34,6 +34,109 @@ async def test_embedding_service_uses_cached_model(monkeypatch, tmp_path):
     vector_single = await service.embed("test tekst")
     vector_many = await service.embed_many(["eerste", "tweede"])
 
-    assert len(vector_single) == 3
-    assert len(vector_many) == 2
-    assert all(len(vec) == 3 for vec in vector_many)
+    assert vector_single.shape == (3,)
+    assert vector_many.shape == (2, 3)
+    assert vector_many.dtype == np.float32
+    assert await service.embed_many_json(["eerste"]) == [[1.0, 2.0, 3.0]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_encode_call(monkeypatch, tmp_path):
+    model = DummySentenceTransformer()
+    monkeypatch.setattr(
+        "backend.app.nlp.embeddings.SentenceTransformer",
+        lambda *args, **kwargs: model,
+    )
+
+    service = EmbeddingService(model_name="dummy", cache_dir=tmp_path)
+
+    single, many, other = await asyncio.gather(
+        service.embed("eerste"),
+        service.embed_many(["tweede", "derde"]),
+        service.embed("vierde"),
+    )
+
+    assert model.calls == [["eerste", "tweede", "derde", "vierde"]]
+    assert single.shape == (3,) and other.shape == (3,)
+    assert many.shape == (2, 3)
+
+
+def test_embed_works_across_successive_event_loops(monkeypatch, tmp_path):
+    model = DummySentenceTransformer()
+    monkeypatch.setattr(
+        "backend.app.nlp.embeddings.SentenceTransformer",
+        lambda *args, **kwargs: model,
+    )
+    service = EmbeddingService(model_name="dummy", cache_dir=tmp_path)
+
+    async def embed_with_timeout(text):
+        return await asyncio.wait_for(service.embed(text), timeout=1)
+
+    async def submit_without_waiting():
+        service._submit(["verlaten"])
+
+    first = asyncio.run(embed_with_timeout("eerste"))
+    second = asyncio.run(embed_with_timeout("tweede"))
+
+    # A loop closed while its flush task is still pending must not block later loops
+    abandoned_loop = asyncio.new_event_loop()
+    abandoned_loop.set_exception_handler(lambda loop, context: None)
+    abandoned_loop.run_until_complete(submit_without_waiting())
+    abandoned_loop.close()
+    third = asyncio.run(embed_with_timeout("derde"))
+
+    assert first.shape == second.shape == third.shape == (3,)
+    assert len(service._queues) == 1
+
+
+class _FakeTensor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.steps: List[str] = []
+
+    def float(self):
+        self.steps.append("float")
+        return self
+
+    def cpu(self):
+        self.steps.append("cpu")
+        return self
+
+    def numpy(self):
+        return np.array(self.rows, dtype=np.float32)
+
+
+class HalfPrecisionModel:
+    def __init__(self, device_type: str):
+        self.device_type = device_type
+        self.halved = False
+
+    def parameters(self):
+        yield SimpleNamespace(device=SimpleNamespace(type=self.device_type))
+
+    def half(self):
+        self.halved = True
+        return self
+
+    def encode(self, texts, normalize_embeddings=True, convert_to_tensor=False, show_progress_bar=False):
+        assert convert_to_tensor
+        return _FakeTensor([[0.5, 0.5] for _ in texts])
+
+
+@pytest.mark.asyncio
+async def test_float16_applies_on_cuda_only(monkeypatch, tmp_path):
+    cuda_model, cpu_model = HalfPrecisionModel("cuda"), HalfPrecisionModel("cpu")
+    models = iter([cuda_model, cpu_model])
+    monkeypatch.setattr(
+        "backend.app.nlp.embeddings.SentenceTransformer",
+        lambda *args, **kwargs: next(models),
+    )
+
+    cuda_service = EmbeddingService(model_name="dummy", cache_dir=tmp_path, dtype="float16")
+    vectors = await cuda_service.embed_many(["eerste", "tweede"])
+    EmbeddingService(model_name="dummy", cache_dir=tmp_path, dtype="float16")._load_model()
+
+    assert cuda_model.halved is True
+    assert cpu_model.halved is False
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (2, 2)
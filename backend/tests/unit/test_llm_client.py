@@ -140,3 +140,125 @@ async def test_mistral_client_raises_on_missing_key() -> None:
     client = MistralClient(settings=Settings(mistral_api_key=None))
     with pytest.raises(LLMAuthenticationError):
         await client.generate("prompt")
+
+
+def test_schemas_normalize_english_spectrum_labels_during_validation() -> None:
+    from backend.app.llm.schemas import InsightCluster
+
+    cluster = InsightCluster.model_validate_json(
+        json.dumps(
+            {
+                "label": "Kritisch",
+                "spectrum": "Left-Wing",
+                "summary": "Samenvatting",
+                "sources": [{"title": "Artikel", "url": "https://example.com/a", "spectrum": "centre"}],
+            }
+        )
+    )
+
+    assert cluster.spectrum == "links"
+    assert cluster.sources[0].spectrum == "mainstream"
+
+
+def test_schema_source_urls_are_validated_as_plain_strings() -> None:
+    from pydantic import ValidationError
+
+    from backend.app.llm.schemas import InsightTimelineItem
+
+    item = InsightTimelineItem(
+        time="2024",
+        headline="Kop",
+        sources=[" https://example.com/a ", "http://example.com"],
+        spectrum="links",
+    )
+
+    assert item.sources == ("https://example.com/a", "http://example.com")
+    with pytest.raises(ValidationError):
+        InsightTimelineItem(time="2024", headline="Kop", sources=["example.com/a"], spectrum="links")
+
+
+def test_schemas_accept_null_for_optional_text_and_counts() -> None:
+    from backend.app.llm.schemas import MediaAnalysis, TimingAnalysis
+
+    timing = TimingAnalysis.model_validate_json('{"why_now": "Begroting", "cui_bono": null, "upcoming_events": null}')
+    media = MediaAnalysis.model_validate(
+        {"source": "NOS", "tone": "feitelijk", "what_if_wrong": None, "anonymous_source_count": None}
+    )
+
+    assert (timing.cui_bono, timing.upcoming_events) == ("", "")
+    assert media.what_if_wrong == ""
+    assert media.anonymous_source_count == 0
+
+
+def test_from_phases_merges_without_revalidating_children() -> None:
+    from backend.app.llm.schemas import CriticalPayload, FactualPayload, InsightsPayload, TimingAnalysis
+
+    factual = FactualPayload(summary="Samenvatting. " * 10, search_keywords=["protest"])
+    critical = CriticalPayload(timing_analysis=TimingAnalysis(why_now="Verkiezingen"))
+
+    merged = InsightsPayload.from_phases(factual, critical)
+
+    assert merged.timing_analysis is critical.timing_analysis
+    assert merged.model_fields_set == set(InsightsPayload.model_fields)
+    assert merged == InsightsPayload.model_validate(merged.model_dump())
+
+
+def test_schema_instances_are_frozen_and_errors_hide_raw_input() -> None:
+    from pydantic import ValidationError
+
+    from backend.app.llm.schemas import TimingAnalysis
+
+    timing = TimingAnalysis(why_now="Verkiezingen")
+    with pytest.raises(ValidationError):
+        timing.why_now = "Anders"
+
+    with pytest.raises(ValidationError) as exc:
+        TimingAnalysis.model_validate({"why_now": "", "cui_bono": "geheim-invoer"})
+    assert "geheim-invoer" not in str(exc.value)
+
+
+def test_schemas_accept_null_for_optional_lists() -> None:
+    from backend.app.llm.schemas import BiasAnalysisPayload, CriticalPayload
+
+    bias = BiasAnalysisPayload.model_validate_json(
+        '{"total_sentences": 3, "journalist_biases": null, "quote_biases": null}'
+    )
+
+    assert bias.journalist_biases == [] and bias.quote_biases == []
+    assert CriticalPayload.model_validate({"statistical_issues": None}).statistical_issues == []
+
+
+def test_involved_country_iso_code_is_normalized_alpha2() -> None:
+    from pydantic import ValidationError
+
+    from backend.app.llm.schemas import InvolvedCountry
+
+    country = InvolvedCountry(iso_code=" il", name="Israel", relevance="Betrokken partij")
+    assert country.iso_code == "IL"
+    for code in ("ISR", "99"):
+        with pytest.raises(ValidationError):
+            InvolvedCountry(iso_code=code, name="Israel", relevance="Betrokken partij")
+
+
+def test_cited_urls_are_shared_across_sections() -> None:
+    from backend.app.llm.schemas import FactualPayload
+
+    url = "https://example.com/" + "artikel-1"
+    payload = FactualPayload.model_validate(
+        {
+            "summary": "x" * 120,
+            "timeline": [{"time": "2025", "headline": "a", "spectrum": "mainstream", "sources": [url]}],
+            "clusters": [
+                {
+                    "label": "c",
+                    "spectrum": "mainstream",
+                    "source_types": [],
+                    "summary": "s",
+                    "characteristics": [],
+                    "sources": [{"title": "t", "url": url, "spectrum": "mainstream"}],
+                }
+            ],
+        }
+    )
+
+    assert payload.timeline[0].sources[0] is payload.clusters[0].sources[0].url
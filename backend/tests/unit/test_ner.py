@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from backend.app.nlp.ner import NamedEntityExtractor, _extract_locations_from_title
+
+
+def _ent(text: str, label: str, start: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(text=text, label_=label, start_char=start, end_char=start + len(text))
+
+
+class DummyModel:
+    def __init__(self, ents_by_text: dict[str, list[SimpleNamespace]]) -> None:
+        self.ents_by_text = ents_by_text
+        self.calls = 0
+
+    def __call__(self, text: str) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(ents=self.ents_by_text.get(text, []))
+
+    def pipe(self, texts, batch_size: int = 64):
+        return (self(text) for text in texts)
+
+
+def test_title_locations_match_whole_names_in_title_order() -> None:
+    title = "Brand in Alphen aan den Rijn, ook Terneuzen en Amsterdam getroffen; Terneuzen ontruimd"
+
+    assert _extract_locations_from_title(title) == ["Alphen aan den rijn", "Terneuzen", "Amsterdam"]
+
+
+def test_title_locations_ignore_partial_words() -> None:
+    assert _extract_locations_from_title("Amsterdammers demonstreren bij de dam") == []
+    assert _extract_locations_from_title("") == []
+
+
+def test_analyze_many_parses_each_text_once_and_matches_single_calls() -> None:
+    text = "Op 3 mei in Rotterdam"
+    ents = [_ent("3 mei", "DATE", 3), _ent("Rotterdam", "GPE", 12), _ent("nos", "LOC")]
+    model = DummyModel({text: ents})
+    extractor = NamedEntityExtractor(model=model)
+
+    [analysis, empty] = extractor.analyze_many([text, ""], ["Drukte in Terneuzen", "Utrecht"])
+
+    assert model.calls == 1
+    assert analysis.dates == ["3 mei"]
+    assert analysis.locations == ["Rotterdam", "Terneuzen"]
+    assert analysis.entities == extractor.extract(text)
+    assert analysis.locations == extractor.extract_locations(text, "Drukte in Terneuzen")
+    assert (empty.entities, empty.dates, empty.locations) == ([], [], [])
+
+
+def test_extractor_skips_pipes_ner_does_not_need() -> None:
+    class PipelineModel(DummyModel):
+        pipe_names = ["tok2vec", "morphologizer", "parser", "lemmatizer", "ner"]
+
+        def __call__(self, text: str, disable=()):
+            self.disabled = list(disable)
+            return super().__call__(text)
+
+    model = PipelineModel({})
+    NamedEntityExtractor(model=model).extract("Tekst")
+
+    assert model.disabled == ["morphologizer", "parser", "lemmatizer"]
+
+
+def test_locations_and_dates_are_deduplicated_case_insensitively() -> None:
+    text = "Rotterdam en ROTTERDAM, Nieuw-Vennep, Zwijndrecht, NOS; 3 mei en 3 Mei"
+    ents = [
+        _ent("Rotterdam", "GPE"),
+        _ent("ROTTERDAM ", "LOC"),
+        _ent("Nieuw-Vennep", "GPE"),
+        _ent("Zwijndrecht", "GPE"),
+        _ent("NOS", "ORG"),
+        _ent("nos", "LOC"),
+        _ent("3 mei", "DATE"),
+        _ent("3 Mei", "DATE"),
+    ]
+    extractor = NamedEntityExtractor(model=DummyModel({text: ents}))
+
+    assert extractor.extract_locations(text, title="Onrust in rotterdam en Delft") == [
+        "Rotterdam",
+        "Nieuw-Vennep",
+        "Delft",
+    ]
+    assert extractor.extract_dates(text) == ["3 mei"]
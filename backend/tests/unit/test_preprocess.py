@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from backend.app.nlp.preprocess import TextPreprocessor
 
 
@@ -26,6 +28,10 @@ class DummyModel:
         tokens = [DummyToken(chunk, self.stopwords) for chunk in text.split()]
         return DummyDoc(tokens)
 
+    def pipe(self, texts, batch_size: int = 64):
+        self.piped = list(texts)
+        return (self(text) for text in self.piped)
+
 
 def test_preprocessor_removes_stopwords_and_normalizes():
     stopwords = {"de", "het", "een"}
@@ -38,3 +44,59 @@ def test_preprocessor_removes_stopwords_and_normalizes():
     assert "demonstranten" in result.tokens
     assert result.normalized_text.startswith("demonstranten")
     assert all(token.islower() for token in result.tokens)
+
+
+def test_normalize_many_matches_normalize_and_skips_empty_texts():
+    dummy_model = DummyModel({"de", "het", "een"})
+    preprocessor = TextPreprocessor(model=dummy_model)
+    texts = ["De demonstranten  waren druk.", "", "Het kabinet valt"]
+
+    results = preprocessor.normalize_many(texts)
+
+    assert [r.tokens for r in results] == [preprocessor.normalize(t).tokens for t in texts]
+    assert dummy_model.piped == ["De demonstranten waren druk.", "Het kabinet valt"]
+
+
+def test_preprocessor_skips_parser_and_ner():
+    class PipelineModel(DummyModel):
+        pipe_names = ["tok2vec", "morphologizer", "parser", "lemmatizer", "attribute_ruler", "ner"]
+
+        def __call__(self, text: str, disable=()):
+            self.disabled = list(disable)
+            return super().__call__(text)
+
+    model = PipelineModel(set())
+    TextPreprocessor(model=model).normalize("Het kabinet valt")
+
+    assert model.disabled == ["parser", "ner"]
+
+
+def test_docs_with_to_array_filter_tokens_from_one_flag_array():
+    class ArrayDoc(DummyDoc):
+        def to_array(self, names):
+            self.requested = list(names)
+            rows = [[getattr(token, name.lower()) for name in names] for token in self]
+            return np.array(rows, dtype=np.uint64)
+
+    class ArrayModel(DummyModel):
+        def __call__(self, text: str) -> ArrayDoc:
+            self.doc = ArrayDoc(super().__call__(text))
+            return self.doc
+
+    text = "De 3 demonstranten , waren het druk in Den Haag ."
+    stopwords = {"de", "het", "een"}
+    array_model = ArrayModel(stopwords)
+
+    result = TextPreprocessor(model=array_model).normalize(text)
+
+    assert array_model.doc.requested == ["IS_SPACE", "IS_PUNCT", "IS_DIGIT", "LIKE_NUM", "IS_STOP"]
+    assert result.tokens == TextPreprocessor(model=DummyModel(stopwords)).normalize(text).tokens
+    assert result.tokens == ["demonstranten", "waren", "druk", "in", "den", "haag"]
+
+
+def test_token_fast_path_keeps_regex_semantics():
+    preprocessor = TextPreprocessor(model=DummyModel(set()), remove_stopwords=False)
+
+    result = preprocessor.normalize("café ĳsbaan zuid-holland 's-hertogenbosch Ελλάδα a/b e-mail:")
+
+    assert result.tokens == ["café", "ijsbaan", "zuid-holland", "'s-hertogenbosch", "ελλάδα"]
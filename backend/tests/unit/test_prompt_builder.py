@@ -143,3 +143,248 @@ async def test_missing_article_content_raises_clear_error(session_factory: async
         await builder.build_prompt(event_id)
 
     assert "verrijkingsstap" in str(exc.value)
+
+
+def test_prompt_cache_key_tracks_article_updates_and_evicts_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    from backend.app.llm import prompt_builder
+
+    now = datetime.now(timezone.utc)
+    event = SimpleNamespace(id=1, last_updated_at=now)
+    articles = [SimpleNamespace(id=2, updated_at=now), SimpleNamespace(id=1, updated_at=now)]
+    key = prompt_builder._prompt_cache_key("factual", event, articles, "template", 5)
+
+    assert key == prompt_builder._prompt_cache_key("factual", event, list(reversed(articles)), "template", 5)
+    articles[0].updated_at = now + timedelta(minutes=1)
+    assert key != prompt_builder._prompt_cache_key("factual", event, articles, "template", 5)
+
+    monkeypatch.setattr(prompt_builder, "PROMPT_CACHE_SIZE", 2)
+    prompt_builder.clear_prompt_cache()
+    results = [
+        prompt_builder.PromptGenerationResult(
+            prompt=str(idx), prompt_length=1, selected_article_ids=[], selected_count=0, total_articles=0
+        )
+        for idx in range(3)
+    ]
+    for idx, result in enumerate(results):
+        prompt_builder._store_cached_prompt(("k", idx), result)
+
+    assert prompt_builder._get_cached_prompt(("k", 0)) is None
+    assert prompt_builder._get_cached_prompt(("k", 2)) is results[2]
+    prompt_builder.clear_prompt_cache()
+
+
+def test_render_template_fills_segments_without_rescanning_inserted_text() -> None:
+    from backend.app.llm.prompt_builder import _render_template
+
+    template = "A {event_context} B {article_capsules} C {factual_summary}"
+    rendered = _render_template(
+        template,
+        event_context="ctx {article_capsules}",
+        article_capsules="caps",
+    )
+
+    assert rendered == "A ctx {article_capsules} B caps C {factual_summary}"
+
+
+def test_fit_block_count_matches_linear_trimming() -> None:
+    from backend.app.llm.prompt_builder import CAPSULE_SEPARATOR, _fit_block_count, _render_template
+
+    template = "Header {event_context}\n{article_capsules}\nFooter"
+    context = "context"
+    blocks = ["a" * 40, "b" * 75, "c" * 10, "d" * 120]
+
+    for max_chars in range(0, 320, 7):
+        expected = len(blocks)
+        while expected > 1:
+            rendered = _render_template(
+                template,
+                event_context=context,
+                article_capsules=CAPSULE_SEPARATOR.join(blocks[:expected]),
+            )
+            if len(rendered) <= max_chars:
+                break
+            expected -= 1
+        assert _fit_block_count(template, context, blocks, max_chars) == expected
+
+
+def test_split_sentences_breaks_on_terminator_followed_by_whitespace() -> None:
+    from backend.app.llm.prompt_builder import _split_sentences
+
+    text = "  Eerste zin. Tweede  zin!\n\nDerde?Nog steeds derde. 3.5 miljard!  "
+
+    assert _split_sentences(text) == [
+        "Eerste zin.",
+        "Tweede  zin!",
+        "Derde?Nog steeds derde.",
+        "3.5 miljard!",
+    ]
+    assert _split_sentences("   ") == []
+    assert _split_sentences("Zonder punt") == ["Zonder punt"]
+
+
+def test_extract_entities_dedupes_descriptors_in_first_seen_order() -> None:
+    from types import SimpleNamespace
+
+    from backend.app.llm.prompt_builder import _extract_entities
+
+    article = SimpleNamespace(
+        entities=[
+            {"text": "Den Haag", "label": "GPE"},
+            {"name": "Rutte", "type": "PERSON"},
+            {"text": "Den Haag", "label": "GPE"},
+            {"text": "  ", "label": "ORG"},
+            "geen mapping",
+            {"text": "Den Haag"},
+        ]
+    )
+
+    assert _extract_entities(article) == ["Den Haag (GPE)", "Rutte (PERSON)", "Den Haag"]
+
+
+def test_coerce_source_fields_memoizes_shared_sources() -> None:
+    from backend.app.llm.prompt_builder import SPECTRUM_FALLBACK, _coerce_source_fields
+
+    memo: dict = {}
+    first = _coerce_source_fields({"spectrum": "Links", "media_type": "private_media"}, memo)
+    second = _coerce_source_fields({"political_spectrum": "Links", "type": "private_media"}, memo)
+
+    assert first == ("links", "private_media")
+    assert second is first
+    assert _coerce_source_fields(None, memo) == (SPECTRUM_FALLBACK, "onbekend")
+    assert _coerce_source_fields({"spectrum": ["links"]}, memo) == ("['links']", "onbekend")
+
+
+def test_select_balanced_subset_round_robins_and_fills_last_round_by_recency() -> None:
+    from backend.app.llm.prompt_builder import ArticleCapsule
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def capsule(article_id: int, spectrum: str, hours: int, *, international: bool = False) -> ArticleCapsule:
+        moment = base + timedelta(hours=hours)
+        return ArticleCapsule(
+            article_id=article_id,
+            title="t",
+            url="https://example.com",
+            spectrum=spectrum,
+            source_name="bron",
+            source_type="onbekend",
+            published_at=moment,
+            fetched_at=moment,
+            summary="",
+            key_points=[],
+            entities=[],
+            is_international=international,
+        )
+
+    capsules = [
+        capsule(1, "links", 10),
+        capsule(2, "links", 9),
+        capsule(3, "links", 8),
+        capsule(4, "rechts", 1),
+        capsule(5, "rechts", 7),
+        capsule(6, "center", 2),
+        capsule(7, "center", 0, international=True),
+    ]
+    builder = PromptBuilder(session_factory=None, settings=Settings())
+
+    selected = builder._select_balanced_subset(capsules, limit=5)
+
+    # International first, one full round (1, 5, 6), then the freshest second-round head (2).
+    assert [item.article_id for item in selected] == [1, 2, 5, 6, 7]
+
+
+def test_select_balanced_subset_skips_selection_log_when_info_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    import logging
+
+    from backend.app.llm import prompt_builder
+
+    calls: list[dict] = []
+    monkeypatch.setattr(prompt_builder, "LOG", SimpleLogStub(calls))
+    builder = PromptBuilder(session_factory=None, settings=Settings())
+
+    stdlib_log = prompt_builder._STDLIB_LOG
+    original_level = stdlib_log.level
+    try:
+        stdlib_log.setLevel(logging.WARNING)
+        builder._select_balanced_subset([], limit=3)
+        assert calls == []
+
+        stdlib_log.setLevel(logging.INFO)
+        builder._select_balanced_subset([], limit=3)
+    finally:
+        stdlib_log.setLevel(original_level)
+    assert calls == [
+        {"event": "article_selection", "article_ids": [], "spectra": [], "international_count": 0, "dutch_count": 0}
+    ]
+
+
+class SimpleLogStub:
+    def __init__(self, calls: list[dict]) -> None:
+        self.calls = calls
+
+    def info(self, event: str, **kwargs: object) -> None:
+        self.calls.append({"event": event, **kwargs})
+
+
+def test_coerce_source_fields_interns_labels_across_builds() -> None:
+    from backend.app.llm.prompt_builder import _coerce_source_fields
+
+    first, _ = _coerce_source_fields({"spectrum": "Rechts"}, {})
+    second, _ = _coerce_source_fields({"spectrum": "rechts"}, {})
+
+    assert first is second
+
+
+def test_capsule_blocks_are_cached_per_article_version_and_renumbered() -> None:
+    from backend.app.llm import prompt_builder
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    capsule = prompt_builder.ArticleCapsule(
+        article_id=1,
+        title="Titel",
+        url="https://example.com/1",
+        spectrum="links",
+        source_name="Bron",
+        source_type="onbekend",
+        published_at=now,
+        fetched_at=now,
+        summary="Samenvatting",
+        key_points=[],
+        entities=[],
+        updated_at=now,
+    )
+    builder = PromptBuilder(session_factory=None, settings=Settings())
+    prompt_builder.clear_prompt_cache()
+
+    first = builder._format_article_capsule_parts([capsule])
+    capsule.title = "Gewijzigd zonder nieuwe versie"
+    again = builder._format_article_capsule_parts([capsule, capsule])
+
+    assert first[0].startswith("1. Titel\n")
+    assert again == [first[0], "2." + first[0][2:]]
+
+    capsule.updated_at = now + timedelta(minutes=1)
+    assert builder._format_article_capsule_parts([capsule])[0].startswith("1. Gewijzigd zonder nieuwe versie\n")
+    prompt_builder.clear_prompt_cache()
+
+
+@pytest.mark.asyncio
+async def test_db_template_with_broken_placeholders_falls_back_to_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    from backend.app.llm import prompt_builder
+
+    async def get_value(key: str) -> str:
+        return "Alleen {event_context} en {event_context}"
+
+    monkeypatch.setattr(
+        prompt_builder, "get_llm_config_service", lambda: SimpleNamespace(get_value=get_value)
+    )
+
+    assert await prompt_builder._get_prompt_from_db("factual", "fallback") == "fallback"
+    assert prompt_builder._template_placeholder_errors("factual", "Alleen {event_context} en {event_context}") == [
+        "{event_context} komt 2x voor",
+        "{article_capsules} komt 0x voor",
+    ]
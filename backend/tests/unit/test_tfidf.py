@@ -13,3 +13,28 @@ def test_tfidf_manager_fits_and_transforms(tmp_path):
     vector = manager.transform("demonstranten verzamelen zich vreedzaam")
     assert any(term.startswith("demonstranten") for term in vector.keys())
     assert cache_path.exists()
+
+
+def test_transform_many_matches_per_document_transform(tmp_path):
+    manager = TfidfVectorizerManager(cache_path=tmp_path / "tfidf.joblib", max_features=1000)
+    corpus = ["demonstranten verzamelen zich", "", "politie sluit wegen af"]
+
+    vectors = manager.fit_and_transform(corpus)
+
+    assert vectors[1] == {}
+    assert vectors == [manager.transform(doc) for doc in corpus]
+    assert list(vectors[2]) == list(manager.transform(corpus[2]))
+
+
+def test_feature_names_are_computed_once_per_fit(tmp_path, monkeypatch):
+    manager = TfidfVectorizerManager(cache_path=tmp_path / "tfidf.joblib", max_features=1000)
+    manager.fit(["demonstranten verzamelen zich", "politie sluit wegen af"])
+    reloaded = TfidfVectorizerManager(cache_path=tmp_path / "tfidf.joblib", max_features=1000)
+
+    def _fail():
+        raise AssertionError("feature names should be cached")
+
+    for instance in (manager, reloaded):
+        monkeypatch.setattr(instance.vectorizer, "get_feature_names_out", _fail)
+        assert instance.transform("politie sluit wegen af")
+        assert instance.transform_many(["demonstranten", "politie"])[1]